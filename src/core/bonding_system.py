@@ -19,6 +19,15 @@ class BondLevel(Enum):
     BEST_FRIEND = "best_friend"            # 80-100 bond
 
 
+_BOND_DESCRIPTIONS = {
+    BondLevel.STRANGER: "Still getting to know you. Acts cautious and reserved.",
+    BondLevel.ACQUAINTANCE: "Starting to warm up. Occasional displays of affection.",
+    BondLevel.FRIEND: "Trusts you and enjoys your company. Seeks interaction.",
+    BondLevel.CLOSE_FRIEND: "Very attached and affectionate. Shows clear preferences.",
+    BondLevel.BEST_FRIEND: "Deep emotional bond. Misses you when gone, ecstatic when you return."
+}
+
+
 class BondingSystem:
     """
     Manages the emotional bond between owner and pet.
@@ -83,14 +92,17 @@ class BondingSystem:
 
     def get_bond_description(self) -> str:
         """Get a description of the current bond level."""
-        descriptions = {
-            BondLevel.STRANGER: "Still getting to know you. Acts cautious and reserved.",
-            BondLevel.ACQUAINTANCE: "Starting to warm up. Occasional displays of affection.",
-            BondLevel.FRIEND: "Trusts you and enjoys your company. Seeks interaction.",
-            BondLevel.CLOSE_FRIEND: "Very attached and affectionate. Shows clear preferences.",
-            BondLevel.BEST_FRIEND: "Deep emotional bond. Misses you when gone, ecstatic when you return."
-        }
-        return descriptions.get(self.get_bond_level(), "Unknown bond level")
+        return self.compute_bond_view()[1]
+
+    def compute_bond_view(self) -> Tuple[BondLevel, str]:
+        """
+        Get the current bond level and its description in one pass.
+
+        Returns:
+            Tuple of (BondLevel, description)
+        """
+        level = self.get_bond_level()
+        return level, _BOND_DESCRIPTIONS.get(level, "Unknown bond level")
 
     def add_bond(self, amount: float, reason: str = "interaction"):
         """
@@ -119,20 +131,22 @@ class BondingSystem:
         if new_level != old_level:
             self._on_bond_level_up(old_level, new_level)
 
-    def reduce_bond(self, amount: float, reason: str = "neglect"):
+    def reduce_bond(self, amount: float, reason: str = "neglect",
+                    now: Optional[float] = None):
         """
         Decrease bond value (from neglect or negative experiences).
 
         Args:
             amount: Amount to decrease
             reason: Why bond decreased
+            now: Timestamp for the history entry; current time if None
         """
         old_bond = self.bond
         self.bond = max(0, self.bond - amount)
 
         # Record bond change
         self.bond_history.append({
-            'timestamp': time.time(),
+            'timestamp': time.time() if now is None else now,
             'change': self.bond - old_bond,
             'reason': reason,
             'new_bond': self.bond
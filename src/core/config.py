@@ -2,7 +2,7 @@
 Configuration and constants for the Desktop Pal application.
 """
 import os
-from enum import Enum
+from enum import Enum, IntEnum
 
 # Application settings
 APP_NAME = "Desktop Pal"
@@ -26,6 +26,7 @@ HUNGER_DECAY_RATE = 0.1  # Hunger increases by this amount per minute
 STARVATION_THRESHOLD = 100  # Creature dies when hunger reaches this
 MAX_HUNGER = 100
 FEED_AMOUNT = 30  # How much feeding reduces hunger
+VITALS_UPDATE_INTERVAL = 1.0  # Seconds of elapsed time batched into one stat decay step
 
 # Learning settings - Basic Network
 LEARNING_RATE = 0.001  # Lower for Adam optimizer
@@ -157,6 +158,23 @@ class BehaviorState(Enum):
     HIDING = "hiding"
     SEEKING = "seeking"
 
+# Interaction type codes
+class InteractionKind(IntEnum):
+    """Integer codes for creature interaction types (used on hot paths)."""
+    OTHER = 0
+    FEED = 1
+    PLAY_BALL = 2
+    PET = 3
+    TALK = 4
+    GIVE_TOY = 5
+    TOY_INTERACTION = 6
+    PLAY = 7
+    TRAINING = 8
+    BALL_PLAY = 9
+    MOUSE_CHASE = 10
+    HIDE_AND_SEEK = 11
+    HIDE = 12
+
 # Color palettes for creature variation
 COLOR_PALETTES = [
     ["#FF6B6B", "#FFE66D", "#4ECDC4"],  # Red-Yellow-Cyan
@@ -15,12 +15,15 @@ Enhanced with:
 """
 import random
 import time
-from typing import Dict, Any, Optional, Tuple, List
+from collections import deque
+from math import hypot
+import numpy as np
+from typing import Dict, Any, Optional, Tuple, List, Container
 from datetime import datetime
 from .config import (
     PersonalityType, BehaviorState, CREATURE_TYPES, COLOR_PALETTES,
     PERSONALITY_TRAITS, MAX_HUNGER, HUNGER_DECAY_RATE, STARVATION_THRESHOLD,
-    EvolutionStage, ElementType, VariantType
+    VITALS_UPDATE_INTERVAL, EvolutionStage, ElementType, VariantType, InteractionKind
 )
 from .memory_system import IntegratedMemorySystem, MemoryImportance
 from .training_system import TrainingSystem
@@ -32,11 +35,274 @@ from .trust_system import TrustSystem
 from .emotional_states import EmotionalStateManager, EmotionalState
 from .preference_system import PreferenceSystem
 from .name_calling import NameCallingSystem
+from .jit import njit, NUMBA_AVAILABLE
+
+# Phase 6: reinforcement types by value, or None if Phase 6 is not available
+try:
+    from .enhanced_training import ReinforcementType
+    _REINFORCEMENT_MAP = {rtype.value: rtype for rtype in ReinforcementType}
+except ImportError:
+    _REINFORCEMENT_MAP = None
+
+# Phase 7: loaders for the enhanced memory save keys, empty if Phase 7 is not available
+try:
+    from .enhanced_memory import (
+        AutobiographicalMemory, FavoriteMemories, TraumaMemory, AssociativeMemory, DreamSystem
+    )
+    _PHASE7_LOADERS = {
+        'autobiographical_memory': AutobiographicalMemory,
+        'favorite_memories': FavoriteMemories,
+        'trauma_memory': TraumaMemory,
+        'associative_memory': AssociativeMemory,
+        'dream_system': DreamSystem,
+    }
+except ImportError:
+    _PHASE7_LOADERS = {}
+
+# Interaction type strings are translated to InteractionKind once at the API
+# boundary; everything past that point works with integer codes.
+_STR_TO_KIND = {kind.name.lower(): kind for kind in InteractionKind}
+
+# Preference category for interactions involving an item
+_TOY_KINDS = frozenset({InteractionKind.PLAY_BALL, InteractionKind.GIVE_TOY,
+                        InteractionKind.TOY_INTERACTION})
+_FOOD_KINDS = frozenset({InteractionKind.FEED})
+_ACTIVITY_KINDS = frozenset({InteractionKind.PLAY, InteractionKind.TRAINING,
+                             InteractionKind.PET, InteractionKind.TALK})
+
+# Per-kind encodings fed to the social and activity networks, indexed by kind
+_KIND_TYPE_ENCODING = np.full(len(InteractionKind), 0.5)
+_KIND_TYPE_ENCODING[[InteractionKind.FEED, InteractionKind.PLAY_BALL,
+                     InteractionKind.PET, InteractionKind.TALK]] = [0.2, 0.4, 0.6, 0.8]
+
+_KIND_ACTIVITY_ENCODING = np.zeros(len(InteractionKind))
+_KIND_ACTIVITY_ENCODING[[InteractionKind.BALL_PLAY, InteractionKind.MOUSE_CHASE,
+                         InteractionKind.HIDE_AND_SEEK, InteractionKind.HIDE,
+                         InteractionKind.FEED]] = [0.8, 0.6, 0.4, 0.4, 0.2]
+
+
+def _one_hot(index: int, size: int) -> np.ndarray:
+    """Build a read-only one-hot vector."""
+    vector = np.zeros(size)
+    vector[index] = 1.0
+    vector.flags.writeable = False
+    return vector
+
+
+# Personality is fixed for a creature's lifetime, so its one-hot encoding is
+# built once per type and shared
+_PERSONALITY_ONE_HOT = {
+    personality: _one_hot(i, len(PersonalityType))
+    for i, personality in enumerate(PersonalityType)
+}
+
+# Interactions kept in history (and in the struct-of-arrays history ring)
+_HISTORY_LENGTH = 100
+_RING_OFFSETS = np.arange(_HISTORY_LENGTH)
+
+# Interaction quality fed to the emotion network, indexed by positive flag
+_QUALITY_ENCODING = np.array([0.3, 1.0])
+
+# Seconds of interaction history that count towards command fatigue
+_COMMAND_WINDOW = 300
+
+# Particle effects depend only on (primary element, variant), so the combined
+# tuple is computed once per pair and shared by all creatures
+_PARTICLE_EFFECTS_CACHE: Dict[Tuple[ElementType, VariantType], Tuple[str, ...]] = {}
+
+# Stat thresholds for the basic mood reported to the name-calling system
+_HAPPY_MOOD_MIN = 80
+_GRUMPY_MOOD_MAX = 30
+_TIRED_MOOD_MAX = 20
+
+
+def _basic_mood(happiness: float, energy: float) -> Optional[str]:
+    """Derive the basic mood from happiness and energy, or None if neutral."""
+    if happiness > _HAPPY_MOOD_MIN:
+        return 'happy'
+    if happiness < _GRUMPY_MOOD_MAX:
+        return 'grumpy'
+    if energy < _TIRED_MOOD_MAX:
+        return 'tired'
+    return None
+
+
+# Energy regimes understood by _update_vitals
+_ENERGY_RESTING = 0
+_ENERGY_ACTIVE = 1
+_ENERGY_SLEEPING = 2
+
+# Energy regime for every behavior state, so update() needs one lookup
+_ENERGY_REGIMES = dict.fromkeys(BehaviorState, _ENERGY_RESTING)
+_ENERGY_REGIMES.update({
+    BehaviorState.RUNNING: _ENERGY_ACTIVE,
+    BehaviorState.PLAYING: _ENERGY_ACTIVE,
+    BehaviorState.SLEEPING: _ENERGY_SLEEPING,
+})
+
+# Seconds without interaction after which happiness starts to drop
+_NEGLECT_SECONDS = 300.0
+
+# Below this energy the creature wants to sleep
+_SLEEP_ENERGY_MAX = 20
+
+_MAX_HUNGER = float(MAX_HUNGER)
+_HUNGER_DECAY_RATE = float(HUNGER_DECAY_RATE)
+
+
+@njit(cache=True)
+def _update_vitals(hunger, energy, happiness, energy_regime, delta_time,
+                   energy_consumption, time_since_interaction):
+    """
+    Apply one tick of hunger, energy and happiness change.
+
+    Kept free of Python objects so numba can compile it when available.
+
+    Args:
+        hunger: Current hunger (0-100)
+        energy: Current energy (0-100)
+        happiness: Current happiness (0-100)
+        energy_regime: One of the _ENERGY_* regimes
+        delta_time: Time elapsed since last update in seconds
+        energy_consumption: Personality energy consumption multiplier
+        time_since_interaction: Seconds since the last interaction
+
+    Returns:
+        Tuple of (hunger, energy, happiness)
+    """
+    # Update hunger
+    hunger = min(_MAX_HUNGER, hunger + _HUNGER_DECAY_RATE * (delta_time / 60.0))
+
+    # Update energy based on activity
+    if energy_regime == _ENERGY_ACTIVE:
+        energy = max(0.0, energy - 0.5 * delta_time * energy_consumption)
+    elif energy_regime == _ENERGY_SLEEPING:
+        energy = min(100.0, energy + 2.0 * delta_time)
+    else:
+        # Slow energy recovery during idle/walking
+        energy = min(100.0, energy + 0.2 * delta_time)
+
+    # Update happiness based on interactions and care
+    if time_since_interaction > _NEGLECT_SECONDS:  # 5 minutes without interaction
+        happiness = max(0.0, happiness - 0.1 * delta_time)
+
+    # Hunger affects happiness
+    if hunger > 50:
+        happiness = max(0.0, happiness - 0.05 * delta_time * (hunger / 50))
+
+    return hunger, energy, happiness
+
+
+if NUMBA_AVAILABLE:
+    # Compile (or load from the on-disk cache) at import rather than on the
+    # first frame, so the pet does not stutter when the window appears.
+    _update_vitals(0.0, 0.0, 0.0, _ENERGY_RESTING, 0.0, 1.0, 0.0)
+
+
+# Random creation choices, built once
+_PERSONALITIES = tuple(PersonalityType)
+_NAME_PREFIXES = ('Pip', 'Moo', 'Fluff', 'Spark', 'Dash', 'Glow', 'Puff', 'Zip')
+_NAME_SUFFIXES = ('kin', 'zy', 'bit', 'ie', 'er', 'ling', 'y', 'o')
+
+# Keys every creature save must carry; from_dict checks them all up front
+_REQUIRED_SAVE_KEYS = frozenset((
+    'creature_type', 'personality', 'color_palette', 'name',
+    'hunger', 'happiness', 'energy', 'birth_time', 'last_fed_time',
+    'last_interaction_time', 'position', 'interaction_history',
+))
+
+
+def _interaction_kind(interaction_type: Optional[str]) -> InteractionKind:
+    """Translate an interaction type string to its InteractionKind."""
+    return _STR_TO_KIND.get(interaction_type, InteractionKind.OTHER)
+
+
+class InteractionEvent:
+    """A single entry in a creature's interaction history."""
+
+    __slots__ = ('interaction_type', 'positive', 'timestamp', 'hunger_level',
+                 'energy_level', 'happiness_level', 'bond_gain', 'gentle')
+
+    def __init__(self, interaction_type: str, positive: bool, timestamp: float,
+                 hunger_level: float, energy_level: float, happiness_level: float,
+                 bond_gain: float = 0.0, gentle: bool = True):
+        """
+        Initialize interaction event.
+
+        Args:
+            interaction_type: Type of interaction (e.g., 'play_ball', 'pet')
+            positive: Whether the interaction was enjoyed
+            timestamp: When the interaction happened
+            hunger_level: Hunger at the time of the interaction
+            energy_level: Energy at the time of the interaction
+            happiness_level: Happiness at the time of the interaction
+            bond_gain: Bond gained from the interaction
+            gentle: Whether the interaction was gentle
+        """
+        self.interaction_type = interaction_type
+        self.positive = positive
+        self.timestamp = timestamp
+        self.hunger_level = hunger_level
+        self.energy_level = energy_level
+        self.happiness_level = happiness_level
+        self.bond_gain = bond_gain
+        self.gentle = gentle
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize to dictionary."""
+        return {
+            'type': self.interaction_type,
+            'positive': self.positive,
+            'timestamp': self.timestamp,
+            'hunger_level': self.hunger_level,
+            'energy_level': self.energy_level,
+            'happiness_level': self.happiness_level,
+            'bond_gain': self.bond_gain,
+            'gentle': self.gentle
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'InteractionEvent':
+        """Deserialize from dictionary."""
+        return cls(
+            interaction_type=data.get('type', 'other'),
+            positive=data.get('positive', False),
+            timestamp=data.get('timestamp', 0.0),
+            hunger_level=data.get('hunger_level', 0.0),
+            energy_level=data.get('energy_level', 0.0),
+            happiness_level=data.get('happiness_level', 0.0),
+            bond_gain=data.get('bond_gain', 0.0),
+            gentle=data.get('gentle', True)
+        )
 
 
 class Creature:
     """Represents a desktop pal creature with personality, stats, and learning capabilities."""
 
+    __slots__ = (
+        # Identity
+        'creature_type', 'personality', 'color_palette', 'name',
+        # Stats
+        'hunger', 'happiness', 'energy', 'age', 'birth_time', 'last_fed_time',
+        'last_interaction_time', 'total_interactions', 'has_fed_before',
+        '_vitals_elapsed', '_vitals_regime', '_vitals_idle_time',
+        # State
+        'current_state', '_kinematics', 'facing_right',
+        # Learning and behavior
+        'learned_behaviors', 'interaction_history', '_history_kinds',
+        '_history_positive', '_history_head', '_history_len',
+        '_recent_interaction_times',
+        'trait_modifiers', '_energy_consumption', '_happiness_gain',
+        '_personality_vector',
+        # Phase 2-5 subsystems
+        'memory', 'training', 'evolution', 'element', 'variant', 'bonding',
+        'trust', 'emotional_states', 'preferences', 'name_calling',
+        '_favorites_cache',
+        # Phase 7: Enhanced Memory Systems
+        'autobiographical', 'favorite_memories', 'trauma_memory',
+        'associative_memory', 'dream_system', 'memory_manager', 'phase7_enabled',
+    )
+
     def __init__(self, creature_type: str = None, personality: PersonalityType = None,
                  color_palette: list = None, name: str = None):
         """
@@ -49,7 +315,7 @@ class Creature:
             name: Name of the creature. Generated if None.
         """
         self.creature_type = creature_type or random.choice(CREATURE_TYPES)
-        self.personality = personality or random.choice(list(PersonalityType))
+        self.personality = personality or random.choice(_PERSONALITIES)
         self.color_palette = color_palette or random.choice(COLOR_PALETTES)
         self.name = name or self._generate_name()
 
@@ -62,19 +328,40 @@ class Creature:
         self.last_fed_time = time.time()
         self.last_interaction_time = time.time()
         self.total_interactions = 0  # Track total interactions for evolution (Phase 4)
+        self._vitals_elapsed = 0.0  # Elapsed time not yet applied to stat decay
+        self._vitals_regime = _ENERGY_RESTING  # Energy regime of that time
+        self._vitals_idle_time = 0.0  # Time since interaction at its last frame
+        self.has_fed_before = False
 
         # State
         self.current_state = BehaviorState.IDLE
-        self.position = [100, 100]  # x, y position on screen
-        self.velocity = [0, 0]  # x, y velocity
+        # Row 0 is the x, y position on screen, row 1 the x, y velocity.
+        # Kept in one array so movement math can operate on both rows at once.
+        self._kinematics = np.array([[100.0, 100.0], [0.0, 0.0]])
         self.facing_right = True
 
         # Learning and behavior
         self.learned_behaviors = {}
         self.interaction_history = []
 
+        # Struct-of-arrays ring over interaction_history holding what the
+        # networks need: interaction kind code and positive flag per slot.
+        # The next write goes to _history_head.
+        self._history_kinds = np.zeros(_HISTORY_LENGTH, dtype=np.int8)
+        self._history_positive = np.zeros(_HISTORY_LENGTH, dtype=np.uint8)
+        self._history_head = 0
+        self._history_len = 0
+
+        # Timestamps of recorded interactions inside the command window,
+        # oldest first; expired entries are dropped as compliance is checked
+        self._recent_interaction_times = deque(maxlen=_HISTORY_LENGTH)
+
         # Personality trait modifiers
         self.trait_modifiers = PERSONALITY_TRAITS[self.personality]
+        # Read on every update/interaction; the personality never changes
+        self._energy_consumption = float(self.trait_modifiers.get('energy_consumption', 1.0))
+        self._happiness_gain = float(self.trait_modifiers.get('happiness_gain', 1.0))
+        self._personality_vector = _PERSONALITY_ONE_HOT[self.personality]
 
         # Phase 2: Enhanced Memory System
         self.memory = IntegratedMemorySystem(
@@ -108,6 +395,9 @@ class Creature:
         self.preferences = PreferenceSystem(personality_type=self.personality.value)
         self.name_calling = NameCallingSystem()
 
+        # (preferences.version, favorites) from the last get_favorite_items call
+        self._favorites_cache = None
+
         # Phase 7: Enhanced Memory Systems
         try:
             from .enhanced_memory import (
@@ -155,76 +445,103 @@ class Creature:
             rare_message = self.variant.get_encounter_message()
             # This message will be shown by pet_manager when creature hatches
 
+    @property
+    def position(self) -> np.ndarray:
+        """x, y position on screen (a view; element writes propagate)."""
+        return self._kinematics[0]
+
+    @position.setter
+    def position(self, value):
+        self._kinematics[0] = value
+
+    @property
+    def velocity(self) -> np.ndarray:
+        """x, y velocity (a view; element writes propagate)."""
+        return self._kinematics[1]
+
+    @velocity.setter
+    def velocity(self, value):
+        self._kinematics[1] = value
+
     def _generate_name(self) -> str:
         """Generate a random name for the creature."""
-        prefixes = ['Pip', 'Moo', 'Fluff', 'Spark', 'Dash', 'Glow', 'Puff', 'Zip']
-        suffixes = ['kin', 'zy', 'bit', 'ie', 'er', 'ling', 'y', 'o']
-        return random.choice(prefixes) + random.choice(suffixes)
+        return random.choice(_NAME_PREFIXES) + random.choice(_NAME_SUFFIXES)
 
-    def update(self, delta_time: float):
+    def update(self, delta_time: float, now: Optional[float] = None):
         """
         Update creature state based on elapsed time.
 
         Args:
             delta_time: Time elapsed since last update in seconds.
+            now: Current time (e.g. the frame timestamp); looked up if None
         """
-        # Update age
-        self.age = time.time() - self.birth_time
-
-        # Update hunger
-        minutes_elapsed = delta_time / 60.0
-        hunger_increase = HUNGER_DECAY_RATE * minutes_elapsed
-        self.hunger = min(MAX_HUNGER, self.hunger + hunger_increase)
-
-        # Update energy based on activity
-        if self.current_state in [BehaviorState.RUNNING, BehaviorState.PLAYING]:
-            energy_drain = 0.5 * delta_time * self.trait_modifiers.get('energy_consumption', 1.0)
-            self.energy = max(0, self.energy - energy_drain)
-        elif self.current_state == BehaviorState.SLEEPING:
-            energy_gain = 2.0 * delta_time
-            self.energy = min(100, self.energy + energy_gain)
-        else:
-            # Slow energy recovery during idle/walking
-            energy_gain = 0.2 * delta_time
-            self.energy = min(100, self.energy + energy_gain)
-
-        # Update happiness based on interactions and care
-        time_since_interaction = time.time() - self.last_interaction_time
-        if time_since_interaction > 300:  # 5 minutes without interaction
-            happiness_decay = 0.1 * delta_time
-            self.happiness = max(0, self.happiness - happiness_decay)
+        if now is None:
+            now = time.time()
 
-        # Hunger affects happiness
-        if self.hunger > 50:
-            happiness_decay = 0.05 * delta_time * (self.hunger / 50)
-            self.happiness = max(0, self.happiness - happiness_decay)
+        # Update age
+        self.age = now - self.birth_time
+
+        time_since_interaction = now - self.last_interaction_time
+
+        # Update hunger, energy and happiness. The decay is linear in elapsed
+        # time, so short frame deltas are accumulated and applied together.
+        # Time already pending is applied first if the energy regime or the
+        # neglect check changes, so each frame is charged at its own rate.
+        regime = _ENERGY_REGIMES[self.current_state]
+        if self._vitals_elapsed > 0.0 and (
+                regime != self._vitals_regime
+                or (time_since_interaction > _NEGLECT_SECONDS)
+                != (self._vitals_idle_time > _NEGLECT_SECONDS)):
+            self._apply_vitals()
+        self._vitals_elapsed += delta_time
+        self._vitals_regime = regime
+        self._vitals_idle_time = time_since_interaction
+        if self._vitals_elapsed >= VITALS_UPDATE_INTERVAL:
+            self._apply_vitals()
 
         # Phase 5: Update emotional states
-        self.emotional_states.update(delta_time)
+        self.emotional_states.update(delta_time, now)
 
         # Phase 5: Process bonding decay from neglect
         hours_since_interaction = time_since_interaction / 3600.0
         if hours_since_interaction > 1:
             self.bonding.process_neglect(hours_since_interaction)
 
-        # Phase 5: Update presence tracking
+    def _apply_vitals(self):
+        """Apply the elapsed time accumulated by update() to the stats."""
+        elapsed = self._vitals_elapsed
+        self._vitals_elapsed = 0.0
+
+        self.hunger, self.energy, self.happiness = _update_vitals(
+            float(self.hunger), float(self.energy), float(self.happiness),
+            self._vitals_regime, float(elapsed),
+            self._energy_consumption,
+            self._vitals_idle_time
+        )
+
+        # Phase 5: Update presence tracking. Time together is linear in
+        # elapsed time too, so it rides on the same batched step.
         # Note: This assumes owner is present if app is running
         # In a more complete implementation, this could track actual user presence
-        self.bonding.update_presence(is_present=True, delta_time=delta_time)
+        self.bonding.update_presence(is_present=True, delta_time=elapsed)
 
-    def feed(self, amount: float = 30, food_type: str = "generic"):
+    def feed(self, amount: float = 30, food_type: str = "generic", now: Optional[float] = None):
         """
         Feed the creature, reducing hunger.
 
         Args:
             amount: Amount to reduce hunger (default 30)
             food_type: Type of food being given (for preferences)
+            now: Current time (e.g. the frame timestamp); looked up if None
         """
+        if now is None:
+            now = time.time()
+
         old_hunger = self.hunger
-        self.hunger = max(0, self.hunger - amount)
-        self.last_fed_time = time.time()
-        self.happiness = min(100, self.happiness + 5)
-        self.last_interaction_time = time.time()
+        self.hunger = max(0.0, self.hunger - amount)
+        self.last_fed_time = now
+        self.happiness = min(100.0, self.happiness + 5)
+        self.last_interaction_time = now
 
         # Phase 5: Determine if feeding was timely based on hunger level
         timely = old_hunger > 40  # Feeding when actually hungry is timely
@@ -249,7 +566,8 @@ class Creature:
 
         # Record in memory system (Phase 2)
         # Check if this is first feeding
-        first_feeding = self.memory.recall_event('feed', first_only=True) is None
+        first_feeding = not self.has_fed_before
+        self.has_fed_before = True
         importance = MemoryImportance.CRUCIAL.value if first_feeding else MemoryImportance.NORMAL.value
 
         self.memory.record_interaction(
@@ -263,14 +581,16 @@ class Creature:
                 'positive': True,
                 'timely': timely,
                 'bond_gain': bond_gain,
-                'stats': {'hunger': self.hunger, 'happiness': self.happiness, 'energy': self.energy}
+                'stats_hunger': self.hunger,
+                'stats_happiness': self.happiness,
+                'stats_energy': self.energy
             },
             important=first_feeding,
             emotional_intensity=0.7 if old_hunger > 70 else 0.5
         )
 
     def interact(self, interaction_type: str, positive: bool = True,
-                 item: str = None, gentle: bool = True):
+                 item: str = None, gentle: bool = True, now: Optional[float] = None):
         """
         Record an interaction with the creature.
 
@@ -279,8 +599,12 @@ class Creature:
             positive: Whether the interaction was positive (enjoyed) or negative
             item: Specific item involved (toy name, food type, etc.)
             gentle: Whether interaction was gentle (affects trust)
+            now: Current time (e.g. the frame timestamp); looked up if None
         """
-        self.last_interaction_time = time.time()
+        if now is None:
+            now = time.time()
+
+        self.last_interaction_time = now
         self.total_interactions += 1  # Phase 4: Track for evolution
 
         # Phase 5: Determine quality of interaction
@@ -303,15 +627,18 @@ class Creature:
         # Phase 5: Reset attention to others tracking (receiving attention)
         self.emotional_states.reset_attention_tracking()
 
+        # Encode the type once; both the preference mapping and the history use it
+        kind = _interaction_kind(interaction_type)
+
         # Phase 5: Update preferences based on interaction
         if item:
             # Map interaction type to preference category
             category = None
-            if interaction_type in ['play_ball', 'give_toy', 'toy_interaction']:
+            if kind in _TOY_KINDS:
                 category = 'toy'
-            elif interaction_type in ['feed']:
+            elif kind in _FOOD_KINDS:
                 category = 'food'
-            elif interaction_type in ['play', 'training', 'pet', 'talk']:
+            elif kind in _ACTIVITY_KINDS:
                 category = 'activity'
 
             if category:
@@ -321,32 +648,27 @@ class Creature:
                 self.preferences.record_experience(category, item or interaction_type, enjoyment)
 
         # Record in history for neural network learning
-        interaction_data = {
-            'type': interaction_type,
-            'positive': positive,
-            'timestamp': time.time(),
-            'hunger_level': self.hunger,
-            'energy_level': self.energy,
-            'happiness_level': self.happiness,
-            'bond_gain': bond_gain,
-            'gentle': gentle
-        }
-        self.interaction_history.append(interaction_data)
-
-        # Keep only recent history (last 100 interactions)
-        if len(self.interaction_history) > 100:
-            self.interaction_history = self.interaction_history[-100:]
+        self._record_interaction(InteractionEvent(
+            interaction_type,
+            positive,
+            now,
+            self.hunger,
+            self.energy,
+            self.happiness,
+            bond_gain,
+            gentle
+        ), kind)
 
         # Update happiness
         happiness_change = 3 if positive else -1
-        happiness_multiplier = self.trait_modifiers.get('happiness_gain', 1.0)
+        happiness_multiplier = self._happiness_gain
         variant_multiplier = self.variant.get_happiness_multiplier()  # Phase 4
 
         # Phase 5: Apply emotional state modifiers
-        emotional_mods = self.emotional_states.get_behavioral_modifiers()
+        emotional_mods = self.emotional_states.get_behavioral_modifiers(now)
         happiness_multiplier *= emotional_mods.get('happiness_modifier', 1.0)
 
-        self.happiness = max(0, min(100, self.happiness + happiness_change * happiness_multiplier * variant_multiplier))
+        self.happiness = max(0.0, min(100.0, self.happiness + happiness_change * happiness_multiplier * variant_multiplier))
 
         # Phase 4: Check for evolution after interaction
         self._check_evolution(EvolutionTrigger.INTERACTION)
@@ -361,11 +683,9 @@ class Creature:
                 'item': item,
                 'bond_gain': bond_gain,
                 'quality': quality,
-                'stats': {
-                    'hunger': self.hunger,
-                    'happiness': self.happiness,
-                    'energy': self.energy
-                },
+                'stats_hunger': self.hunger,
+                'stats_happiness': self.happiness,
+                'stats_energy': self.energy,
                 'outcome': 'enjoyed' if positive else 'disliked'
             },
             important=False,
@@ -378,20 +698,71 @@ class Creature:
 
     def should_sleep(self) -> bool:
         """Determine if creature should sleep based on energy."""
-        return self.energy < 20
+        return self.energy < _SLEEP_ENERGY_MAX
+
+    @property
+    def preference_scores(self) -> np.ndarray:
+        """Read-only activity preference scores in PreferenceSystem ACTIVITY_SLOTS order."""
+        scores = self.preferences.activity_scores.view()
+        scores.flags.writeable = False
+        return scores
 
     def get_preferred_activity(self) -> str:
         """Get the creature's currently most preferred activity."""
-        # Filter out being_fed from activities
-        activities = {k: v for k, v in self.preference_scores.items() if k != 'being_fed'}
-        if not activities:
-            return 'idle'
-        return max(activities.items(), key=lambda x: x[1])[0]
+        return self.preferences.get_preferred_activity() or 'idle'
 
     def set_state(self, state: BehaviorState):
         """Change the creature's behavior state."""
         self.current_state = state
 
+    def _record_interaction(self, event: InteractionEvent,
+                            kind: Optional[InteractionKind] = None):
+        """
+        Append an event to the interaction history and its encoding rings.
+
+        Args:
+            event: The interaction to record
+            kind: Already-encoded interaction type; derived from the event if None
+        """
+        if kind is None:
+            kind = _interaction_kind(event.interaction_type)
+
+        self.interaction_history.append(event)
+
+        # Keep only recent history (last 100 interactions)
+        if len(self.interaction_history) > _HISTORY_LENGTH:
+            self.interaction_history = self.interaction_history[-_HISTORY_LENGTH:]
+
+        head = self._history_head
+        self._history_kinds[head] = kind
+        self._history_positive[head] = event.positive
+        self._history_head = (head + 1) % _HISTORY_LENGTH
+        if self._history_len < _HISTORY_LENGTH:
+            self._history_len += 1
+
+        self._recent_interaction_times.append(event.timestamp)
+
+    def _recent_encoded(self, lut: np.ndarray, codes: np.ndarray, count: int,
+                        pad: float) -> list:
+        """
+        Encode the last count interactions through a lookup table.
+
+        Args:
+            lut: Encoding lookup table indexed by code
+            codes: History ring column holding the codes
+            count: Number of values to return
+            pad: Value for slots older than the recorded history
+
+        Returns:
+            List of count encodings, oldest first, left-padded with pad
+        """
+        encoded = np.full(count, pad)
+        n = min(count, self._history_len)
+        if n:
+            slots = (self._history_head - n + _RING_OFFSETS[:n]) % _HISTORY_LENGTH
+            encoded[count - n:] = lut[codes[slots]]
+        return encoded.tolist()
+
     def get_recent_interaction_quality(self, count: int = 10) -> list:
         """
         Get quality scores of recent interactions for emotion network.
@@ -402,22 +773,7 @@ class Creature:
         Returns:
             List of quality scores (0-1 scale) for recent interactions
         """
-        if not self.interaction_history:
-            return [0.5] * count
-
-        recent = self.interaction_history[-count:]
-        quality = []
-
-        for interaction in recent:
-            # Calculate quality based on positive feedback
-            q = 1.0 if interaction.get('positive', False) else 0.3
-            quality.append(q)
-
-        # Pad if needed
-        while len(quality) < count:
-            quality.insert(0, 0.5)
-
-        return quality[:count]
+        return self._recent_encoded(_QUALITY_ENCODING, self._history_positive, count, 0.5)
 
     def get_recent_interaction_types(self, count: int = 5) -> list:
         """
@@ -429,22 +785,7 @@ class Creature:
         Returns:
             List of encoded interaction types
         """
-        if not self.interaction_history:
-            return [0.0] * count
-
-        recent = self.interaction_history[-count:]
-        type_mapping = {'feed': 0.2, 'play_ball': 0.4, 'pet': 0.6, 'talk': 0.8, 'other': 0.5}
-
-        encoded = []
-        for interaction in recent:
-            interaction_type = interaction.get('type', 'other')
-            encoded.append(type_mapping.get(interaction_type, 0.5))
-
-        # Pad if needed
-        while len(encoded) < count:
-            encoded.insert(0, 0.0)
-
-        return encoded[:count]
+        return self._recent_encoded(_KIND_TYPE_ENCODING, self._history_kinds, count, 0.0)
 
     def get_recent_activities(self, count: int = 5) -> list:
         """
@@ -458,52 +799,93 @@ class Creature:
         """
         # This is a simplified version - in a more complete implementation,
         # we would track activity history similar to interaction history
-        if not self.interaction_history:
-            return [0.0] * count
-
         # Use interaction history as proxy for activities
-        recent = self.interaction_history[-count:]
-        activities = []
-
-        for interaction in recent:
-            # Map interaction types to activity encodings
-            itype = interaction.get('type', 'idle')
-            if itype == 'ball_play':
-                activities.append(0.8)
-            elif itype == 'mouse_chase':
-                activities.append(0.6)
-            elif itype in ['hide_and_seek', 'hide']:
-                activities.append(0.4)
-            elif itype == 'feed':
-                activities.append(0.2)
-            else:
-                activities.append(0.0)
-
-        # Pad if needed
-        while len(activities) < count:
-            activities.insert(0, 0.0)
-
-        return activities[:count]
+        return self._recent_encoded(_KIND_ACTIVITY_ENCODING, self._history_kinds, count, 0.0)
 
-    def get_personality_vector(self) -> list:
+    def get_personality_vector(self) -> np.ndarray:
         """
         Get one-hot encoded personality vector for networks.
 
         Returns:
-            List representing personality as one-hot encoding
+            Read-only array representing personality as one-hot encoding
         """
-        personalities = list(PersonalityType)
-        encoding = [0.0] * len(personalities)
+        return self._personality_vector
 
-        try:
-            idx = personalities.index(self.personality)
-            encoding[idx] = 1.0
-        except ValueError:
-            pass
+    def get_movement_state(self, target_x: float = None, target_y: float = None,
+                           out: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Get the subset of state read by MovementNetwork.
 
-        return encoding
+        Args:
+            target_x: Optional target x coordinate for movement
+            target_y: Optional target y coordinate for movement
+            out: Optional dict to fill in place instead of allocating a new one
+
+        Returns:
+            Dictionary with position, target, velocity and edge information
+        """
+        state = {} if out is None else out
+
+        # Calculate distance to target if provided
+        pos_x, pos_y = self.position.tolist()
+        vel_x, vel_y = self.velocity.tolist()
 
-    def get_state_for_networks(self, target_x: float = None, target_y: float = None) -> Dict[str, Any]:
+        distance_to_target = 0.0
+        if target_x is not None and target_y is not None:
+            distance_to_target = hypot(target_x - pos_x, target_y - pos_y)
+
+        state['energy'] = self.energy
+        state['pos_x'] = pos_x
+        state['pos_y'] = pos_y
+        state['target_x'] = target_x if target_x is not None else pos_x
+        state['target_y'] = target_y if target_y is not None else pos_y
+        state['distance_to_target'] = distance_to_target
+        state['velocity_x'] = vel_x
+        state['velocity_y'] = vel_y
+        state['personality_vector'] = self.get_personality_vector()
+
+        # Screen edge distances (will be filled by sensory system or pet_manager)
+        state['edge_top'] = 0
+        state['edge_bottom'] = 0
+        state['edge_left'] = 0
+        state['edge_right'] = 0
+        return state
+
+    def get_emotion_state(self, out: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Get the subset of state read by EmotionNetwork (filled into out if given)."""
+        state = {} if out is None else out
+        state['hunger'] = self.hunger
+        state['energy'] = self.energy
+        state['happiness'] = self.happiness
+        state['recent_interaction_quality'] = self.get_recent_interaction_quality(10)
+        state['personality_vector'] = self.get_personality_vector()
+        return state
+
+    def get_social_state(self, out: Optional[Dict[str, Any]] = None,
+                         now: Optional[float] = None) -> Dict[str, Any]:
+        """Get the subset of state read by SocialNetwork (filled into out if given)."""
+        state = {} if out is None else out
+        if now is None:
+            now = time.time()
+        state['time_since_interaction'] = now - self.last_interaction_time
+        state['recent_interaction_types'] = self.get_recent_interaction_types(5)
+        # Player mood estimate (simplified - could be enhanced)
+        state['player_mood_estimate'] = 0.5 if self.happiness > 60 else 0.3
+        return state
+
+    def get_activity_state(self, out: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Get the subset of state read by ActivityNetwork (filled into out if given)."""
+        state = {} if out is None else out
+        state['hunger'] = self.hunger
+        state['energy'] = self.energy
+        state['happiness'] = self.happiness
+        state['recent_activities'] = self.get_recent_activities(5)
+        # Emotional state placeholder (will be filled by emotion network)
+        state['emotional_state'] = [0.5, 0.5, 0.5, 0.5, 0.5]
+        return state
+
+    def get_state_for_networks(self, target_x: float = None, target_y: float = None,
+                               out: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Get comprehensive state dictionary for all AI networks.
 
@@ -514,71 +896,43 @@ class Creature:
         - SocialNetwork
         - ReinforcementLearning systems
 
+        Callers that only feed a single network should use the narrower
+        get_movement_state / get_emotion_state / get_social_state /
+        get_activity_state builders instead.
+
+        A new dict is returned unless out is given; a per-tick caller can
+        pass the same dict each time to have it refilled in place.
+
         Args:
             target_x: Optional target x coordinate for movement
             target_y: Optional target y coordinate for movement
+            out: Optional dict to fill in place instead of a new one
 
         Returns:
             Dictionary with complete state information
         """
-        import math
-
-        # Calculate distance to target if provided
-        distance_to_target = 0.0
-        if target_x is not None and target_y is not None:
-            dx = target_x - self.position[0]
-            dy = target_y - self.position[1]
-            distance_to_target = math.sqrt(dx * dx + dy * dy)
-
-        return {
-            # Basic stats
-            'hunger': self.hunger,
-            'energy': self.energy,
-            'happiness': self.happiness,
-            'age': self.age,
-
-            # Position and movement
-            'pos_x': self.position[0],
-            'pos_y': self.position[1],
-            'target_x': target_x if target_x is not None else self.position[0],
-            'target_y': target_y if target_y is not None else self.position[1],
-            'distance_to_target': distance_to_target,
-            'velocity_x': self.velocity[0],
-            'velocity_y': self.velocity[1],
-
-            # Time-based
-            'time_since_interaction': time.time() - self.last_interaction_time,
-            'time_since_fed': time.time() - self.last_fed_time,
-
-            # Personality
-            'personality': self.personality.value,
-            'personality_vector': self.get_personality_vector(),
-
-            # Learning and history
-            'recent_interaction_quality': self.get_recent_interaction_quality(10),
-            'recent_interaction_types': self.get_recent_interaction_types(5),
-            'recent_activities': self.get_recent_activities(5),
-
-            # Preferences
-            'preference_scores': self.preference_scores.copy(),
+        now = time.time()
+        state = {} if out is None else out
+        self.get_movement_state(target_x, target_y, out=state)
+        self.get_emotion_state(out=state)
+        self.get_social_state(out=state, now=now)
+        self.get_activity_state(out=state)
 
-            # State
-            'current_state': self.current_state.value,
-            'alive': not self.is_starving(),
-            'should_sleep': self.should_sleep(),
+        state['age'] = self.age
+        state['time_since_fed'] = now - self.last_fed_time
 
-            # Emotional state placeholder (will be filled by emotion network)
-            'emotional_state': [0.5, 0.5, 0.5, 0.5, 0.5],
+        # Personality
+        state['personality'] = self.personality.value
 
-            # Player mood estimate (simplified - could be enhanced)
-            'player_mood_estimate': 0.5 if self.happiness > 60 else 0.3,
+        # Preferences
+        state['preference_scores'] = self.preference_scores
 
-            # Screen edge distances (will be filled by sensory system or pet_manager)
-            'edge_top': 0,
-            'edge_bottom': 0,
-            'edge_left': 0,
-            'edge_right': 0,
-        }
+        # State
+        state['current_state'] = self.current_state.value
+        # Same checks as is_starving()/should_sleep(), on the values just written
+        state['alive'] = state['hunger'] < STARVATION_THRESHOLD
+        state['should_sleep'] = state['energy'] < _SLEEP_ENERGY_MAX
+        return state
 
     # ============ Phase 2: Training & Memory Methods ============
 
@@ -695,7 +1049,7 @@ class Creature:
             'happiness': self.happiness,
             'bond': self.bonding.bond,  # Phase 5: Use bonding system
             'total_interactions': self.total_interactions,
-            'tricks_learned': len(self.get_known_tricks())
+            'tricks_learned': self.training.get_known_trick_count()
         }
 
     def can_evolve(self) -> Tuple[bool, Optional[EvolutionStage], str]:
@@ -755,7 +1109,7 @@ class Creature:
         happiness_change = result.get('happiness_change', 0)
         bond_change = result.get('bond_change', 0)
 
-        self.happiness = max(0, min(100, self.happiness + happiness_change))
+        self.happiness = max(0.0, min(100.0, self.happiness + happiness_change))
         # Phase 5: Use bonding system for bond changes
         if bond_change > 0:
             self.bonding.add_bond(bond_change, 'elemental_interaction')
@@ -802,7 +1156,7 @@ class Creature:
                 'energy': self.energy,
                 'bond': self.bonding.bond  # Phase 5: Use bonding system
             },
-            'known_tricks': len(self.get_known_tricks()),
+            'known_tricks': self.training.get_known_trick_count(),
             'total_interactions': self.total_interactions
         }
 
@@ -813,24 +1167,35 @@ class Creature:
         Returns:
             List of particle effect identifiers
         """
-        effects = []
+        return list(self.get_particle_effects_tuple())
 
-        # Element-based particles
-        effects.append(self.element.get_particle_effect_type())
+    def get_particle_effects_tuple(self) -> Tuple[str, ...]:
+        """
+        Get particle effects to display as a shared, immutable tuple.
 
-        # Variant-based particles
-        effects.extend(self.variant.get_particle_effects())
+        Renderers polling every frame should prefer this over
+        get_particle_effects, which copies the result into a new list.
 
+        Returns:
+            Tuple of particle effect identifiers
+        """
+        key = (self.element.primary_element, self.variant.variant)
+        effects = _PARTICLE_EFFECTS_CACHE.get(key)
+        if effects is None:
+            # Element-based particles, then variant-based particles
+            effects = (self.element.get_particle_effect_type(),) + tuple(self.variant.get_particle_effects())
+            _PARTICLE_EFFECTS_CACHE[key] = effects
         return effects
 
     # ============ Phase 5: Advanced Bonding Methods ============
 
-    def call_by_name(self, called_name: str) -> Dict[str, Any]:
+    def call_by_name(self, called_name: str, now: Optional[float] = None) -> Dict[str, Any]:
         """
         Call the pet by name and get response.
 
         Args:
             called_name: Name being called
+            now: Current time (e.g. the frame timestamp); looked up if None
 
         Returns:
             Dictionary with response details (responded, animation, message, bond_change)
@@ -839,13 +1204,7 @@ class Creature:
         name_recognition = self.training.name_recognition.recognition_proficiency
 
         # Get current mood (basic version using happiness)
-        current_mood = None
-        if self.happiness > 80:
-            current_mood = 'happy'
-        elif self.happiness < 30:
-            current_mood = 'grumpy'
-        elif self.energy < 20:
-            current_mood = 'tired'
+        current_mood = _basic_mood(self.happiness, self.energy)
 
         # Call the pet
         result = self.name_calling.call_pet(
@@ -881,7 +1240,7 @@ class Creature:
 
             # Mark first time called by name
             if self.bonding.first_time_called_by_name is None:
-                self.bonding.first_time_called_by_name = time.time()
+                self.bonding.first_time_called_by_name = time.time() if now is None else now
 
         return result
 
@@ -911,28 +1270,18 @@ class Creature:
         Args:
             hours_away: How many hours owner was gone
         """
-        # Trigger excited return emotional state
-        self.emotional_states.trigger_excited_return(
+        # Trigger excited return and update owner presence
+        reunion = self.emotional_states.apply_owner_return(
             bond_level=self.bonding.bond,
+            trust_level=self.trust.trust,
             hours_away=hours_away
         )
 
-        # Update bonding system presence
-        self.emotional_states.set_owner_presence(
-            present=True,
-            bond_level=self.bonding.bond,
-            trust_level=self.trust.trust
-        )
-
         # Record in memory if significant absence
         if hours_away > 2:
             self.memory.record_interaction(
                 'owner_returned',
-                {
-                    'hours_away': hours_away,
-                    'bond_level': self.bonding.bond,
-                    'excitement_level': self.emotional_states.reunion_excitement_level
-                },
+                reunion,
                 important=(hours_away > 6),
                 emotional_intensity=min(1.0, hours_away / 6)
             )
@@ -986,6 +1335,9 @@ class Creature:
         Returns:
             Dictionary with favorite items
         """
+        if self._favorites_cache is not None and self._favorites_cache[0] == self.preferences.version:
+            return dict(self._favorites_cache[1])
+
         favorites = self.preferences.get_favorites()
 
         # Also add top preference from each category
@@ -997,7 +1349,8 @@ class Creature:
         favorites['top_food'] = top_foods[0][0] if top_foods else None
         favorites['top_activity'] = top_activities[0][0] if top_activities else None
 
-        return favorites
+        self._favorites_cache = (self.preferences.version, favorites)
+        return dict(favorites)
 
     def get_bond_level_name(self) -> str:
         """Get the name of current bond level."""
@@ -1005,10 +1358,11 @@ class Creature:
 
     def get_bonding_stats(self) -> Dict[str, Any]:
         """Get detailed bonding statistics."""
+        bond_level, bond_description = self.bonding.compute_bond_view()
         stats = {
             'bond': self.bonding.bond,
-            'bond_level': self.bonding.get_bond_level().value,
-            'bond_description': self.bonding.get_bond_description(),
+            'bond_level': bond_level.value,
+            'bond_description': bond_description,
             'trust': self.trust.trust,
             'trust_description': self.trust.get_trust_level_description(),
             'emotional_states': self.emotional_states.get_current_states(),
@@ -1041,11 +1395,10 @@ class Creature:
         }
 
         # Apply reinforcement if Phase 6 is enabled
-        if self.training.phase6_enabled and self.training.reinforcement:
-            try:
-                from .enhanced_training import ReinforcementType
-                rtype = ReinforcementType(reinforcement_type)
-
+        if self.training.phase6_enabled and self.training.reinforcement and _REINFORCEMENT_MAP:
+            # Unknown reinforcement types are ignored
+            rtype = _REINFORCEMENT_MAP.get(reinforcement_type)
+            if rtype is not None:
                 effects = self.training.reinforcement.apply_reinforcement(
                     rtype,
                     trick_name,
@@ -1053,24 +1406,27 @@ class Creature:
                     self.trait_modifiers
                 )
 
-                # Apply effects
-                self.bonding.add_bond(effects['bond_change'], 'training_reinforcement')
-                self.trust.process_training_reinforcement(
-                    trust_change=effects['trust_change'],
-                    was_positive=(effects['trust_change'] >= 0)
-                )
-                self.happiness = max(0, min(100, self.happiness + effects['happiness_change']))
+                # Apply effects, skipping stats the reinforcement leaves untouched
+                bond_change = effects['bond_change']
+                trust_change = effects['trust_change']
+                happiness_change = effects['happiness_change']
+                if bond_change:
+                    self.bonding.add_bond(bond_change, 'training_reinforcement')
+                if trust_change:
+                    self.trust.process_training_reinforcement(
+                        trust_change=trust_change,
+                        was_positive=(trust_change >= 0)
+                    )
+                if happiness_change:
+                    self.happiness = max(0.0, min(100.0, self.happiness + happiness_change))
 
                 result['reinforcement_applied'] = True
                 result['reinforcement_effects'] = effects
                 result['message'] += f" {effects['message']}"
 
-            except (ImportError, ValueError):
-                pass  # Phase 6 not available or invalid reinforcement type
-
         return result
 
-    def check_command_compliance(self, command: str) -> Tuple[bool, str]:
+    def check_command_compliance(self, command: str, now: Optional[float] = None) -> Tuple[bool, str]:
         """
         Check if pet will comply with a command based on current state.
 
@@ -1078,14 +1434,18 @@ class Creature:
 
         Args:
             command: Command to check
+            now: Current time (e.g. the frame timestamp); looked up if None
 
         Returns:
             Tuple of (will_comply, refusal_reason)
         """
         # Count recent commands (last 5 minutes)
-        now = time.time()
-        recent_commands = sum(1 for h in self.interaction_history
-                            if now - h['timestamp'] < 300)
+        if now is None:
+            now = time.time()
+        recent_times = self._recent_interaction_times
+        while recent_times and now - recent_times[0] >= _COMMAND_WINDOW:
+            recent_times.popleft()
+        recent_commands = len(recent_times)
 
         if self.training.phase6_enabled and self.training.stubbornness_calc:
             # Phase 6: Advanced stubbornness calculation
@@ -1132,8 +1492,8 @@ class Creature:
             Dictionary with training analytics
         """
         stats = {
-            'known_tricks': len(self.get_known_tricks()),
-            'learning_tricks': len(self.get_learning_tricks()),
+            'known_tricks': self.training.get_known_trick_count(),
+            'learning_tricks': self.training.get_learning_trick_count(),
             'mastered_tricks': len(self.training.get_mastered_tricks()) if hasattr(self.training, 'get_mastered_tricks') else 0,
             'phase6_enabled': self.training.phase6_enabled
         }
@@ -1153,12 +1513,13 @@ class Creature:
 
     # ============ Phase 7: Enhanced Memory Methods ============
 
-    def process_sleep_cycle(self, sleep_duration_hours: float):
+    def process_sleep_cycle(self, sleep_duration_hours: float, now: Optional[float] = None):
         """
         Process dreaming during sleep (Phase 7).
 
         Args:
             sleep_duration_hours: How long the pet has been sleeping
+            now: Current time (e.g. the frame timestamp); looked up if None
         """
         if not self.phase7_enabled or not self.dream_system:
             return
@@ -1166,11 +1527,13 @@ class Creature:
         # Check if should dream
         hours_since_dream = 999  # Default to trigger first dream
         if self.dream_system.last_dream_time:
-            hours_since_dream = (time.time() - self.dream_system.last_dream_time) / 3600
+            if now is None:
+                now = time.time()
+            hours_since_dream = (now - self.dream_system.last_dream_time) / 3600
 
         if self.dream_system.should_dream(True, hours_since_dream):
             # Get recent memories for dream processing
-            recent_memories = self.interaction_history[-20:] if self.interaction_history else []
+            recent_memories = [event.to_dict() for event in self.interaction_history[-20:]]
 
             # Process dream
             emotional_state = self.happiness / 100.0
@@ -1202,7 +1565,8 @@ class Creature:
         if not self.phase7_enabled or not self.autobiographical:
             return False
 
-        emotional_intensity = min(1.0, self.happiness / 100.0 + 0.3)
+        # Offset and clamp on the 0-100 stat scale, then normalize once
+        emotional_intensity = min(100.0, self.happiness + 30.0) / 100.0
         was_first_time = self.autobiographical.record_first_time(
             event_type, details, emotional_intensity
         )
@@ -1248,8 +1612,9 @@ class Creature:
         self.trauma_memory.record_trauma(event_type, details, severity, trigger)
 
         # Traumatic experiences affect trust and bond
-        self.trust.reduce_trust(severity * 10, 'traumatic_experience')
-        self.bonding.reduce_bond(severity * 5, 'traumatic_experience')
+        now = time.time()
+        self.trust.reduce_trust(severity * 10, 'traumatic_experience', now)
+        self.bonding.reduce_bond(severity * 5, 'traumatic_experience', now)
 
     def check_fear_trigger(self, trigger: str) -> Tuple[bool, float]:
         """
@@ -1355,8 +1720,55 @@ class Creature:
         stats['phase7_enabled'] = True
         return stats
 
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert creature to dictionary for saving (with Phases 2-7)."""
+    # (save key, subsystem attribute, feature flag attribute or None) for every
+    # subsystem serialized by to_dict, in save order
+    _SUBSYSTEM_SERIALIZERS = (
+        # Phase 2: Memory and Training
+        ('memory_system', 'memory', None),
+        ('training_system', 'training', None),
+        # Phase 4: Evolution, Element, Variant
+        ('evolution_system', 'evolution', None),
+        ('element_system', 'element', None),
+        ('variant_system', 'variant', None),
+        # Phase 5: Advanced Bonding Systems
+        ('bonding_system', 'bonding', None),
+        ('trust_system', 'trust', None),
+        ('emotional_states', 'emotional_states', None),
+        ('preference_system', 'preferences', None),
+        ('name_calling_system', 'name_calling', None),
+        # Phase 7: Enhanced Memory Systems
+        ('autobiographical_memory', 'autobiographical', 'phase7_enabled'),
+        ('favorite_memories', 'favorite_memories', 'phase7_enabled'),
+        ('trauma_memory', 'trauma_memory', 'phase7_enabled'),
+        ('associative_memory', 'associative_memory', 'phase7_enabled'),
+        ('dream_system', 'dream_system', 'phase7_enabled'),
+    )
+
+    # Class whose from_dict restores each subsystem save key
+    _SUBSYSTEM_LOADERS = dict({
+        'memory_system': IntegratedMemorySystem,
+        'training_system': TrainingSystem,
+        'evolution_system': EvolutionSystem,
+        'element_system': ElementSystem,
+        'variant_system': VariantSystem,
+        'bonding_system': BondingSystem,
+        'trust_system': TrustSystem,
+        'emotional_states': EmotionalStateManager,
+        'preference_system': PreferenceSystem,
+        'name_calling_system': NameCallingSystem,
+    }, **_PHASE7_LOADERS)
+
+    def to_dict(self, include: Optional[Container[str]] = None) -> Dict[str, Any]:
+        """
+        Convert creature to dictionary for saving (with Phases 2-7).
+
+        Args:
+            include: Subsystem save keys to serialize. All subsystems if None;
+                core stats and interaction history are always included.
+
+        Returns:
+            Dictionary of creature state
+        """
         data = {
             'creature_type': self.creature_type,
             'personality': self.personality.value,
@@ -1366,46 +1778,34 @@ class Creature:
             'happiness': self.happiness,
             'energy': self.energy,
             'total_interactions': self.total_interactions,
+            'has_fed_before': self.has_fed_before,
             'birth_time': self.birth_time,
             'last_fed_time': self.last_fed_time,
             'last_interaction_time': self.last_interaction_time,
-            'position': self.position,
-            'interaction_history': self.interaction_history,
-            # Phase 2: Memory and Training
-            'memory_system': self.memory.to_dict(),
-            'training_system': self.training.to_dict(),
-            # Phase 4: Evolution, Element, Variant
-            'evolution_system': self.evolution.to_dict(),
-            'element_system': self.element.to_dict(),
-            'variant_system': self.variant.to_dict(),
-            # Phase 5: Advanced Bonding Systems
-            'bonding_system': self.bonding.to_dict(),
-            'trust_system': self.trust.to_dict(),
-            'emotional_states': self.emotional_states.to_dict(),
-            'preference_system': self.preferences.to_dict(),
-            'name_calling_system': self.name_calling.to_dict(),
-            # Phase 7: Enhanced Memory Systems
+            'position': self.position.tolist(),
+            'interaction_history': [event.to_dict() for event in self.interaction_history],
             'phase7_enabled': self.phase7_enabled
         }
 
-        # Phase 7: Save enhanced memory systems
-        if self.phase7_enabled:
-            if self.autobiographical:
-                data['autobiographical_memory'] = self.autobiographical.to_dict()
-            if self.favorite_memories:
-                data['favorite_memories'] = self.favorite_memories.to_dict()
-            if self.trauma_memory:
-                data['trauma_memory'] = self.trauma_memory.to_dict()
-            if self.associative_memory:
-                data['associative_memory'] = self.associative_memory.to_dict()
-            if self.dream_system:
-                data['dream_system'] = self.dream_system.to_dict()
+        for key, attr, flag in self._SUBSYSTEM_SERIALIZERS:
+            if include is not None and key not in include:
+                continue
+            if flag is not None and not getattr(self, flag):
+                continue
+            subsystem = getattr(self, attr)
+            if subsystem is not None:
+                data[key] = subsystem.to_dict()
 
         return data
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Creature':
         """Create a creature from a dictionary (with Phases 2-5)."""
+        # Fail before building any subsystems if the save is incomplete
+        missing = _REQUIRED_SAVE_KEYS.difference(data)
+        if missing:
+            raise KeyError(f"Creature save is missing: {', '.join(sorted(missing))}")
+
         personality = PersonalityType(data['personality'])
         creature = cls(
             creature_type=data['creature_type'],
@@ -1414,70 +1814,35 @@ class Creature:
             name=data['name']
         )
 
-        creature.hunger = data['hunger']
-        creature.happiness = data['happiness']
-        creature.energy = data['energy']
+        creature.hunger = float(data['hunger'])
+        creature.happiness = float(data['happiness'])
+        creature.energy = float(data['energy'])
         creature.total_interactions = data.get('total_interactions', 0)
         creature.birth_time = data['birth_time']
         creature.last_fed_time = data['last_fed_time']
         creature.last_interaction_time = data['last_interaction_time']
         creature.position = data['position']
-        creature.interaction_history = data['interaction_history']
-
-        # Phase 2: Restore memory and training if present
-        if 'memory_system' in data:
-            creature.memory = IntegratedMemorySystem.from_dict(data['memory_system'])
-
-        if 'training_system' in data:
-            creature.training = TrainingSystem.from_dict(data['training_system'])
-
-        # Phase 4: Restore evolution, element, variant if present
-        if 'evolution_system' in data:
-            creature.evolution = EvolutionSystem.from_dict(data['evolution_system'])
-
-        if 'element_system' in data:
-            creature.element = ElementSystem.from_dict(data['element_system'])
-
-        if 'variant_system' in data:
-            creature.variant = VariantSystem.from_dict(data['variant_system'])
-
-        # Phase 5: Restore bonding systems if present
-        if 'bonding_system' in data:
-            creature.bonding = BondingSystem.from_dict(data['bonding_system'])
-
-        if 'trust_system' in data:
-            creature.trust = TrustSystem.from_dict(data['trust_system'])
-
-        if 'emotional_states' in data:
-            creature.emotional_states = EmotionalStateManager.from_dict(data['emotional_states'])
-
-        if 'preference_system' in data:
-            creature.preferences = PreferenceSystem.from_dict(data['preference_system'])
-
-        if 'name_calling_system' in data:
-            creature.name_calling = NameCallingSystem.from_dict(data['name_calling_system'])
-
-        # Phase 7: Restore enhanced memory systems if present
-        if data.get('phase7_enabled', False) and creature.phase7_enabled:
-            if 'autobiographical_memory' in data:
-                from .enhanced_memory import AutobiographicalMemory
-                creature.autobiographical = AutobiographicalMemory.from_dict(data['autobiographical_memory'])
-
-            if 'favorite_memories' in data:
-                from .enhanced_memory import FavoriteMemories
-                creature.favorite_memories = FavoriteMemories.from_dict(data['favorite_memories'])
-
-            if 'trauma_memory' in data:
-                from .enhanced_memory import TraumaMemory
-                creature.trauma_memory = TraumaMemory.from_dict(data['trauma_memory'])
-
-            if 'associative_memory' in data:
-                from .enhanced_memory import AssociativeMemory
-                creature.associative_memory = AssociativeMemory.from_dict(data['associative_memory'])
-
-            if 'dream_system' in data:
-                from .enhanced_memory import DreamSystem
-                creature.dream_system = DreamSystem.from_dict(data['dream_system'])
+        for event in data['interaction_history']:
+            creature._record_interaction(InteractionEvent.from_dict(event))
+
+        # Phase 2-7: Restore every subsystem present in the save. Feature
+        # gated subsystems are only restored if enabled in both the save and
+        # this build.
+        for key, attr, flag in cls._SUBSYSTEM_SERIALIZERS:
+            state = data.get(key)
+            if state is None:
+                continue
+            if flag is not None and not (data.get(flag, False) and getattr(creature, flag)):
+                continue
+            loader = cls._SUBSYSTEM_LOADERS.get(key)
+            if loader is not None:
+                setattr(creature, attr, loader.from_dict(state))
+
+        # Older saves only know about past feedings through episodic memory
+        if 'has_fed_before' in data:
+            creature.has_fed_before = data['has_fed_before']
+        else:
+            creature.has_fed_before = creature.memory.recall_event('feed', first_only=True) is not None
 
         return creature
 
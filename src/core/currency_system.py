@@ -4,7 +4,9 @@ Phase 13: Currency System
 Manages coins, transactions, and wallet for the pet economy.
 """
 import time
-from typing import Dict, Any, List, Optional
+from collections import deque
+from datetime import date, datetime, timedelta
+from typing import Deque, Dict, Any, List, Optional
 from enum import Enum
 
 
@@ -21,9 +23,18 @@ class TransactionType(Enum):
     REFUND = "refund"                    # Refund from return
 
 
+# Save/summary keys per transaction type, avoiding the Enum.value descriptor
+_TYPE_KEYS = {transaction_type: transaction_type.value for transaction_type in TransactionType}
+
+
 class Transaction:
     """Represents a currency transaction."""
 
+    __slots__ = (
+        'transaction_id', 'transaction_type', 'amount', 'description',
+        'timestamp', 'balance_after',
+    )
+
     def __init__(self, transaction_id: str, transaction_type: TransactionType,
                  amount: int, description: str = ""):
         """
@@ -46,7 +57,7 @@ class Transaction:
         """Serialize to dictionary."""
         return {
             'transaction_id': self.transaction_id,
-            'transaction_type': self.transaction_type.value,
+            'transaction_type': _TYPE_KEYS[self.transaction_type],
             'amount': self.amount,
             'description': self.description,
             'timestamp': self.timestamp,
@@ -79,15 +90,26 @@ class CurrencySystem:
     - Transaction history
     """
 
-    def __init__(self, starting_balance: int = 100):
+    def __init__(self, starting_balance: int = 100, max_history: int = 1000):
         """
         Initialize currency system.
 
         Args:
             starting_balance: Starting coin balance
+            max_history: Number of most recent transactions to keep
         """
         self.balance = starting_balance
-        self.transactions: List[Transaction] = []
+        self.max_history = max_history
+        # Oldest transactions are dropped once max_history is reached
+        self.transactions: Deque[Transaction] = deque(maxlen=max_history)
+        # The same transactions bucketed by type, in order
+        self._by_type: Dict[TransactionType, Deque[Transaction]] = {}
+        # Saved form of each transaction, built once as it is recorded.
+        # Transactions are not modified after being recorded.
+        self._serialized_transactions: Deque[Dict[str, Any]] = deque(maxlen=max_history)
+
+        # Transaction counter for unique IDs
+        self._transaction_counter = 0
 
         # Limits and settings
         self.daily_allowance = 10
@@ -106,6 +128,28 @@ class CurrencySystem:
         self.earnings_by_type: Dict[str, int] = {}
         self.spending_by_type: Dict[str, int] = {}
 
+        # Cached local date string and the timestamp at which it goes stale
+        self._today_str = ""
+        self._today_expires = 0.0
+
+    def _today(self) -> str:
+        """
+        Get today's local date as YYYY-MM-DD.
+
+        The string is only rebuilt once the cached day has ended.
+
+        Returns:
+            Today's date string
+        """
+        now = time.time()
+        if now >= self._today_expires:
+            today = date.fromtimestamp(now)
+            self._today_str = today.isoformat()
+            self._today_expires = datetime.combine(
+                today + timedelta(days=1), datetime.min.time()
+            ).timestamp()
+        return self._today_str
+
     def add_coins(self, amount: int, transaction_type: TransactionType,
                   description: str = "") -> bool:
         """
@@ -127,9 +171,8 @@ class CurrencySystem:
             amount = self.max_balance - self.balance
 
         # Create transaction
-        transaction_id = f"txn_{int(time.time() * 1000)}"
         transaction = Transaction(
-            transaction_id=transaction_id,
+            transaction_id=self._next_transaction_id(),
             transaction_type=transaction_type,
             amount=amount,
             description=description
@@ -140,15 +183,14 @@ class CurrencySystem:
         transaction.balance_after = self.balance
 
         # Record transaction
-        self.transactions.append(transaction)
+        self._append_transaction(transaction)
         self.total_earned += amount
         self.total_transactions += 1
 
         # Track by type
-        type_key = transaction_type.value
-        if type_key not in self.earnings_by_type:
-            self.earnings_by_type[type_key] = 0
-        self.earnings_by_type[type_key] += amount
+        type_key = _TYPE_KEYS[transaction_type]
+        totals = self.earnings_by_type
+        totals[type_key] = totals.get(type_key, 0) + amount
 
         return True
 
@@ -179,9 +221,8 @@ class CurrencySystem:
                 return False
 
         # Create transaction
-        transaction_id = f"txn_{int(time.time() * 1000)}"
         transaction = Transaction(
-            transaction_id=transaction_id,
+            transaction_id=self._next_transaction_id(),
             transaction_type=transaction_type,
             amount=-amount,  # Negative for spending
             description=description
@@ -192,19 +233,47 @@ class CurrencySystem:
         transaction.balance_after = self.balance
 
         # Record transaction
-        self.transactions.append(transaction)
+        self._append_transaction(transaction)
         self.total_spent += amount
         self.total_transactions += 1
         self.spending_today += amount
 
         # Track by type
-        type_key = transaction_type.value
-        if type_key not in self.spending_by_type:
-            self.spending_by_type[type_key] = 0
-        self.spending_by_type[type_key] += amount
+        type_key = _TYPE_KEYS[transaction_type]
+        totals = self.spending_by_type
+        totals[type_key] = totals.get(type_key, 0) + amount
 
         return True
 
+    def _next_transaction_id(self) -> str:
+        """Generate a unique transaction ID."""
+        self._transaction_counter += 1
+        return f"txn_{self._transaction_counter}"
+
+    def _append_transaction(self, transaction: Transaction,
+                            serialized: Optional[Dict[str, Any]] = None):
+        """
+        Append a transaction to the history and its type index.
+
+        Args:
+            transaction: The processed transaction
+            serialized: Its saved form if already at hand; built if None
+        """
+        transactions = self.transactions
+        if len(transactions) == transactions.maxlen:
+            # The deque is about to drop its oldest entry, which is also the
+            # oldest entry of its type bucket
+            self._by_type[transactions[0].transaction_type].popleft()
+        transactions.append(transaction)
+        self._serialized_transactions.append(
+            transaction.to_dict() if serialized is None else serialized
+        )
+
+        bucket = self._by_type.get(transaction.transaction_type)
+        if bucket is None:
+            bucket = self._by_type[transaction.transaction_type] = deque()
+        bucket.append(transaction)
+
     def can_afford(self, amount: int) -> bool:
         """
         Check if can afford an amount.
@@ -240,8 +309,7 @@ class CurrencySystem:
         if not self.daily_allowance_enabled:
             return None
 
-        from datetime import datetime
-        today = datetime.now().strftime("%Y-%m-%d")
+        today = self._today()
 
         # Check if already claimed today
         if self.last_allowance_date == today:
@@ -259,8 +327,7 @@ class CurrencySystem:
 
     def _check_spending_reset(self):
         """Reset daily spending counter if new day."""
-        from datetime import datetime
-        today = datetime.now().strftime("%Y-%m-%d")
+        today = self._today()
 
         if self.last_spending_reset_date != today:
             self.spending_today = 0
@@ -268,11 +335,11 @@ class CurrencySystem:
 
     def get_recent_transactions(self, count: int = 10) -> List[Transaction]:
         """Get recent transactions."""
-        return self.transactions[-count:]
+        return list(self.transactions)[-count:]
 
     def get_transactions_by_type(self, transaction_type: TransactionType) -> List[Transaction]:
         """Get all transactions of a specific type."""
-        return [t for t in self.transactions if t.transaction_type == transaction_type]
+        return list(self._by_type.get(transaction_type, ()))
 
     def get_earnings_summary(self) -> Dict[str, int]:
         """Get summary of earnings by type."""
@@ -306,18 +373,19 @@ class CurrencySystem:
             'spending_today': self.spending_today,
             'daily_spending_limit': self.daily_spending_limit,
             'can_claim_allowance': (
-                self.last_allowance_date != time.strftime("%Y-%m-%d")
+                self.last_allowance_date != self._today()
                 if self.daily_allowance_enabled else False
             ),
-            'earnings_by_type': self.earnings_by_type,
-            'spending_by_type': self.spending_by_type
+            'earnings_by_type': self.earnings_by_type.copy(),
+            'spending_by_type': self.spending_by_type.copy()
         }
 
     def to_dict(self) -> Dict[str, Any]:
         """Serialize to dictionary."""
         return {
             'balance': self.balance,
-            'transactions': [t.to_dict() for t in self.transactions],
+            'transactions': list(self._serialized_transactions),
+            'max_history': self.max_history,
             'daily_allowance': self.daily_allowance,
             'daily_allowance_enabled': self.daily_allowance_enabled,
             'last_allowance_date': self.last_allowance_date,
@@ -330,20 +398,25 @@ class CurrencySystem:
             'total_spent': self.total_spent,
             'total_transactions': self.total_transactions,
             'earnings_by_type': self.earnings_by_type,
-            'spending_by_type': self.spending_by_type
+            'spending_by_type': self.spending_by_type,
+            'transaction_counter': self._transaction_counter
         }
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'CurrencySystem':
         """Deserialize from dictionary."""
-        system = cls(starting_balance=0)  # Will be overwritten
+        # Balance will be overwritten
+        system = cls(starting_balance=0, max_history=data.get('max_history', 1000))
         system.balance = data.get('balance', 100)
 
-        # Restore transactions
+        # Restore transactions. Only the newest max_history would survive
+        # in the deque, so older ones are not built at all; the loaded dicts
+        # are kept as their saved form.
         transactions_data = data.get('transactions', [])
+        if len(transactions_data) > system.max_history:
+            transactions_data = transactions_data[-system.max_history:]
         for txn_data in transactions_data:
-            transaction = Transaction.from_dict(txn_data)
-            system.transactions.append(transaction)
+            system._append_transaction(Transaction.from_dict(txn_data), txn_data)
 
         system.daily_allowance = data.get('daily_allowance', 10)
         system.daily_allowance_enabled = data.get('daily_allowance_enabled', True)
@@ -358,5 +431,6 @@ class CurrencySystem:
         system.total_transactions = data.get('total_transactions', 0)
         system.earnings_by_type = data.get('earnings_by_type', {})
         system.spending_by_type = data.get('spending_by_type', {})
+        system._transaction_counter = data.get('transaction_counter', 0)
 
         return system
@@ -4,7 +4,8 @@ Phase 14: Customization Presets System
 Allows saving and loading pet outfits and room layouts.
 """
 import time
-from typing import Dict, Any, List, Optional
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Set
 from enum import Enum
 
 
@@ -15,9 +16,26 @@ class PresetType(Enum):
     COMPLETE = "complete"          # Both outfit and room
 
 
+def _discard_from_index(index: Dict[str, Dict[str, Any]], key: str, preset_id: str):
+    """Remove a preset from one index bucket, dropping the bucket when empty."""
+    bucket = index.get(key)
+    if bucket is not None:
+        bucket.pop(preset_id, None)
+        if not bucket:
+            del index[key]
+
+
 class CustomizationPreset:
     """Represents a saved customization preset."""
 
+    __slots__ = (
+        'preset_id', '_name', '_name_lower', 'preset_type',
+        '_description', '_description_lower',
+        'pet_data', 'room_data', 'furniture_data',
+        'created_timestamp', 'modified_timestamp', 'times_applied',
+        'favorite', 'tags', 'thumbnail', '_tag_index',
+    )
+
     def __init__(self, preset_id: str, name: str, preset_type: PresetType):
         """
         Initialize preset.
@@ -30,7 +48,7 @@ class CustomizationPreset:
         self.preset_id = preset_id
         self.name = name
         self.preset_type = preset_type
-        self.description: str = ""
+        self.description = ""
 
         # Saved data
         self.pet_data: Optional[Dict[str, Any]] = None
@@ -42,11 +60,35 @@ class CustomizationPreset:
         self.modified_timestamp = time.time()
         self.times_applied = 0
         self.favorite = False
-        self.tags: List[str] = []
+        self.tags: Set[str] = set()
 
         # Thumbnail/preview (would be image data in real implementation)
         self.thumbnail: Optional[str] = None
 
+        # Tag index of the owning CustomizationPresets, kept in step by
+        # add_tag/remove_tag while the preset is stored there
+        self._tag_index: Optional[Dict[str, Dict[str, 'CustomizationPreset']]] = None
+
+    @property
+    def name(self) -> str:
+        """Preset name."""
+        return self._name
+
+    @name.setter
+    def name(self, value: str):
+        self._name = value
+        self._name_lower = value.lower()  # Used by search_presets
+
+    @property
+    def description(self) -> str:
+        """Preset description."""
+        return self._description
+
+    @description.setter
+    def description(self, value: str):
+        self._description = value
+        self._description_lower = value.lower()  # Used by search_presets
+
     def update_data(self, pet_data: Optional[Dict[str, Any]] = None,
                    room_data: Optional[Dict[str, Any]] = None,
                    furniture_data: Optional[Dict[str, Any]] = None):
@@ -67,12 +109,16 @@ class CustomizationPreset:
     def add_tag(self, tag: str):
         """Add tag to preset."""
         if tag not in self.tags:
-            self.tags.append(tag)
+            self.tags.add(tag)
+            if self._tag_index is not None:
+                self._tag_index.setdefault(tag, {})[self.preset_id] = self
 
     def remove_tag(self, tag: str):
         """Remove tag from preset."""
         if tag in self.tags:
-            self.tags.remove(tag)
+            self.tags.discard(tag)
+            if self._tag_index is not None:
+                _discard_from_index(self._tag_index, tag, self.preset_id)
 
     def to_dict(self) -> Dict[str, Any]:
         """Serialize to dictionary."""
@@ -88,7 +134,7 @@ class CustomizationPreset:
             'modified_timestamp': self.modified_timestamp,
             'times_applied': self.times_applied,
             'favorite': self.favorite,
-            'tags': self.tags,
+            'tags': sorted(self.tags),
             'thumbnail': self.thumbnail
         }
 
@@ -108,7 +154,7 @@ class CustomizationPreset:
         preset.modified_timestamp = data.get('modified_timestamp', time.time())
         preset.times_applied = data.get('times_applied', 0)
         preset.favorite = data.get('favorite', False)
-        preset.tags = data.get('tags', [])
+        preset.tags = set(data.get('tags', []))
         preset.thumbnail = data.get('thumbnail')
         return preset
 
@@ -131,9 +177,16 @@ class CustomizationPresets:
         # Stored presets
         self.presets: Dict[str, CustomizationPreset] = {}
 
+        # Indexes over presets (preset_id -> preset, in insertion order)
+        self._by_type: Dict[PresetType, Dict[str, CustomizationPreset]] = {
+            preset_type: {} for preset_type in PresetType
+        }
+        self._by_tag: Dict[str, Dict[str, CustomizationPreset]] = {}
+
         # Quick access
         self.favorite_presets: List[str] = []  # preset_ids
-        self.recent_presets: List[str] = []    # preset_ids (most recent first)
+        # preset_ids as keys, most recent last
+        self.recent_presets: 'OrderedDict[str, None]' = OrderedDict()
 
         # Settings
         self.max_presets = 50
@@ -144,6 +197,7 @@ class CustomizationPresets:
         self.total_presets_applied = 0
         self.total_presets_deleted = 0
         self.most_used_preset: Optional[str] = None
+        self._most_used_count = 0  # times_applied of most_used_preset
 
         # Preset counter for unique IDs
         self._preset_counter = 0
@@ -174,11 +228,20 @@ class CustomizationPresets:
         preset.description = description
 
         # Store preset
-        self.presets[preset_id] = preset
+        self._store_preset(preset)
         self.total_presets_created += 1
 
         return preset
 
+    def _store_preset(self, preset: CustomizationPreset):
+        """Store a preset and add it to the type and tag indexes."""
+        preset_id = preset.preset_id
+        self.presets[preset_id] = preset
+        self._by_type[preset.preset_type][preset_id] = preset
+        for tag in preset.tags:
+            self._by_tag.setdefault(tag, {})[preset_id] = preset
+        preset._tag_index = self._by_tag
+
     def save_outfit_preset(self, name: str, pet_customization: Any,
                           description: str = "") -> Optional[CustomizationPreset]:
         """
@@ -266,7 +329,11 @@ class CustomizationPresets:
         preset.apply()
         self.total_presets_applied += 1
         self._add_to_recent(preset_id)
-        self._update_most_used()
+
+        # Only this preset's count changed, so it either takes the lead or not
+        if preset.times_applied > self._most_used_count:
+            self._most_used_count = preset.times_applied
+            self.most_used_preset = preset_id
 
         # Return data to apply
         return {
@@ -318,14 +385,20 @@ class CustomizationPresets:
     def delete_preset(self, preset_id: str) -> bool:
         """Delete a preset."""
         if preset_id in self.presets:
-            del self.presets[preset_id]
+            preset = self.presets.pop(preset_id)
+            del self._by_type[preset.preset_type][preset_id]
+            for tag in preset.tags:
+                _discard_from_index(self._by_tag, tag, preset_id)
+            preset._tag_index = None
             self.total_presets_deleted += 1
 
             # Remove from favorites and recent
             if preset_id in self.favorite_presets:
                 self.favorite_presets.remove(preset_id)
-            if preset_id in self.recent_presets:
-                self.recent_presets.remove(preset_id)
+            self.recent_presets.pop(preset_id, None)
+
+            if preset_id == self.most_used_preset:
+                self._update_most_used()
 
             return True
         return False
@@ -343,19 +416,18 @@ class CustomizationPresets:
 
     def _add_to_recent(self, preset_id: str):
         """Add preset to recent list."""
-        # Remove if already in list
-        if preset_id in self.recent_presets:
-            self.recent_presets.remove(preset_id)
-
-        # Add to front
-        self.recent_presets.insert(0, preset_id)
+        # Add, or move to the most recent end if already present
+        self.recent_presets[preset_id] = None
+        self.recent_presets.move_to_end(preset_id)
 
         # Trim to max size
-        if len(self.recent_presets) > self.max_recent:
-            self.recent_presets = self.recent_presets[:self.max_recent]
+        while len(self.recent_presets) > self.max_recent:
+            self.recent_presets.popitem(last=False)
 
     def _update_most_used(self):
-        """Update most used preset."""
+        """Recompute most used preset from scratch."""
+        self.most_used_preset = None
+        self._most_used_count = 0
         if not self.presets:
             return
 
@@ -366,6 +438,7 @@ class CustomizationPresets:
 
         if most_used.times_applied > 0:
             self.most_used_preset = most_used.preset_id
+            self._most_used_count = most_used.times_applied
 
     def get_preset(self, preset_id: str) -> Optional[CustomizationPreset]:
         """Get preset by ID."""
@@ -373,10 +446,7 @@ class CustomizationPresets:
 
     def get_presets_by_type(self, preset_type: PresetType) -> List[CustomizationPreset]:
         """Get all presets of a type."""
-        return [
-            preset for preset in self.presets.values()
-            if preset.preset_type == preset_type
-        ]
+        return list(self._by_type[preset_type].values())
 
     def get_favorite_presets(self) -> List[CustomizationPreset]:
         """Get all favorite presets."""
@@ -388,33 +458,30 @@ class CustomizationPresets:
     def get_recent_presets(self) -> List[CustomizationPreset]:
         """Get recently used presets."""
         return [
-            self.presets[pid] for pid in self.recent_presets
+            self.presets[pid] for pid in reversed(self.recent_presets)
             if pid in self.presets
         ]
 
     def get_presets_by_tag(self, tag: str) -> List[CustomizationPreset]:
         """Get presets with a specific tag."""
-        return [
-            preset for preset in self.presets.values()
-            if tag in preset.tags
-        ]
+        return list(self._by_tag.get(tag, {}).values())
 
     def search_presets(self, query: str) -> List[CustomizationPreset]:
         """Search presets by name or description."""
         query_lower = query.lower()
         return [
             preset for preset in self.presets.values()
-            if query_lower in preset.name.lower() or
-               query_lower in preset.description.lower()
+            if query_lower in preset._name_lower or
+               query_lower in preset._description_lower
         ]
 
     def get_statistics(self) -> Dict[str, Any]:
         """Get presets statistics."""
         return {
             'total_presets': len(self.presets),
-            'outfit_presets': len(self.get_presets_by_type(PresetType.OUTFIT)),
-            'room_presets': len(self.get_presets_by_type(PresetType.ROOM)),
-            'complete_presets': len(self.get_presets_by_type(PresetType.COMPLETE)),
+            'outfit_presets': len(self._by_type[PresetType.OUTFIT]),
+            'room_presets': len(self._by_type[PresetType.ROOM]),
+            'complete_presets': len(self._by_type[PresetType.COMPLETE]),
             'favorite_presets': len(self.favorite_presets),
             'total_created': self.total_presets_created,
             'total_applied': self.total_presets_applied,
@@ -431,7 +498,7 @@ class CustomizationPresets:
                 for preset_id, preset in self.presets.items()
             },
             'favorite_presets': self.favorite_presets,
-            'recent_presets': self.recent_presets,
+            'recent_presets': list(reversed(self.recent_presets)),
             'max_presets': self.max_presets,
             'max_recent': self.max_recent,
             'total_presets_created': self.total_presets_created,
@@ -448,17 +515,23 @@ class CustomizationPresets:
 
         # Restore presets
         presets_data = data.get('presets', {})
-        for preset_id, preset_data in presets_data.items():
-            presets_system.presets[preset_id] = CustomizationPreset.from_dict(preset_data)
+        for preset_data in presets_data.values():
+            presets_system._store_preset(CustomizationPreset.from_dict(preset_data))
 
         presets_system.favorite_presets = data.get('favorite_presets', [])
-        presets_system.recent_presets = data.get('recent_presets', [])
+        # Saved most recent first
+        presets_system.recent_presets = OrderedDict.fromkeys(
+            reversed(data.get('recent_presets', []))
+        )
         presets_system.max_presets = data.get('max_presets', 50)
         presets_system.max_recent = data.get('max_recent', 10)
         presets_system.total_presets_created = data.get('total_presets_created', 0)
         presets_system.total_presets_applied = data.get('total_presets_applied', 0)
         presets_system.total_presets_deleted = data.get('total_presets_deleted', 0)
         presets_system.most_used_preset = data.get('most_used_preset')
+        most_used = presets_system.presets.get(presets_system.most_used_preset)
+        if most_used is not None:
+            presets_system._most_used_count = most_used.times_applied
         presets_system._preset_counter = data.get('preset_counter', 0)
 
         return presets_system
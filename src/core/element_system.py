@@ -6,7 +6,9 @@ Similar to Pokemon type effectiveness but adapted for desktop pal interactions.
 """
 from typing import Dict, Any, List, Optional, Tuple
 from enum import Enum
+from functools import lru_cache
 import random
+import numpy as np
 from core.config import (
     ElementType,
     ELEMENT_ADVANTAGES,
@@ -22,6 +24,230 @@ class ElementalInteraction(Enum):
     IMMUNE = "immune"                    # 0x effectiveness
 
 
+# Effectiveness matrices indexed by [attacker, target] element position
+_ELEMENT_INDEX = {element: i for i, element in enumerate(ElementType)}
+_PRIMARY_EFF = np.ones((len(_ELEMENT_INDEX), len(_ELEMENT_INDEX)))
+_SECONDARY_EFF = np.ones((len(_ELEMENT_INDEX), len(_ELEMENT_INDEX)))
+for _attacker, _ai in _ELEMENT_INDEX.items():
+    for _target, _ti in _ELEMENT_INDEX.items():
+        if _target in ELEMENT_ADVANTAGES.get(_attacker, []):
+            _PRIMARY_EFF[_ai, _ti] = 2.0
+            _SECONDARY_EFF[_ai, _ti] = 1.5  # Secondary element gives smaller bonus
+        elif _attacker in ELEMENT_ADVANTAGES.get(_target, []):
+            _PRIMARY_EFF[_ai, _ti] = 0.5
+            _SECONDARY_EFF[_ai, _ti] = 0.75  # Secondary element gives smaller penalty
+del _attacker, _ai, _target, _ti
+
+_INTERACTION_BY_MULTIPLIER = {
+    2.0: ElementalInteraction.SUPER_EFFECTIVE,
+    1.0: ElementalInteraction.EFFECTIVE,
+    0.5: ElementalInteraction.NOT_EFFECTIVE
+}
+
+
+# Element-specific behavioral modifiers
+_ELEMENT_BEHAVIORS = {
+    ElementType.FIRE: {
+        "energy_level": 1.3,
+        "aggression": 1.2,
+        "movement_speed": 1.2,
+        "patience": 0.7,
+        "warmth_preference": 1.5
+    },
+    ElementType.WATER: {
+        "emotional_stability": 1.3,
+        "adaptability": 1.4,
+        "calm_behavior": 1.3,
+        "flow_movement": 1.2,
+        "moisture_preference": 1.5
+    },
+    ElementType.EARTH: {
+        "stubbornness": 1.2,
+        "patience": 1.4,
+        "stability": 1.5,
+        "grounded_behavior": 1.3,
+        "solid_stance": 1.4
+    },
+    ElementType.AIR: {
+        "movement_speed": 1.4,
+        "curiosity": 1.3,
+        "lightness": 1.5,
+        "attention_span": 0.8,
+        "height_preference": 1.4
+    },
+    ElementType.LIGHT: {
+        "happiness_gain": 1.3,
+        "trust": 1.3,
+        "brightness": 1.5,
+        "optimism": 1.4,
+        "day_activity": 1.3
+    },
+    ElementType.DARK: {
+        "stealth": 1.5,
+        "independence": 1.3,
+        "night_activity": 1.4,
+        "mystery": 1.4,
+        "shadow_affinity": 1.5
+    },
+    ElementType.ELECTRIC: {
+        "energy_level": 1.5,
+        "reaction_speed": 1.4,
+        "unpredictability": 1.2,
+        "spark": 1.3,
+        "charged_behavior": 1.3
+    },
+    ElementType.ICE: {
+        "calm_behavior": 1.4,
+        "precision": 1.3,
+        "cold_resistance": 1.5,
+        "calculated_moves": 1.3,
+        "frost_affinity": 1.4
+    },
+    ElementType.NATURE: {
+        "growth_rate": 1.2,
+        "healing_factor": 1.3,
+        "natural_affinity": 1.5,
+        "outdoor_preference": 1.4,
+        "vitality": 1.3
+    },
+    ElementType.PSYCHIC: {
+        "intelligence": 1.4,
+        "learning_speed": 1.3,
+        "intuition": 1.5,
+        "mental_focus": 1.4,
+        "perception": 1.3
+    },
+    ElementType.NEUTRAL: {
+        "balance": 1.2,
+        "adaptability": 1.3,
+        "versatility": 1.4
+    }
+}
+
+_ELEMENT_TRICK_AFFINITIES = {
+    ElementType.FIRE: ["dance", "jump", "spin"],
+    ElementType.WATER: ["fetch", "swim", "flow"],
+    ElementType.EARTH: ["sit", "stay", "guard"],
+    ElementType.AIR: ["jump", "fly", "spin"],
+    ElementType.LIGHT: ["shine", "dance", "greet"],
+    ElementType.DARK: ["hide", "stealth", "shadow"],
+    ElementType.ELECTRIC: ["zap", "quick", "spark"],
+    ElementType.ICE: ["freeze", "slide", "chill"],
+    ElementType.NATURE: ["grow", "heal", "bloom"],
+    ElementType.PSYCHIC: ["think", "predict", "sense"],
+    ElementType.NEUTRAL: []  # No specific preferences
+}
+
+# Preferred tricks for every (primary, secondary) combination, without duplicates
+_PREFERRED_TRICKS = {
+    (primary, secondary): tuple(dict.fromkeys(
+        _ELEMENT_TRICK_AFFINITIES.get(primary, []) +
+        (_ELEMENT_TRICK_AFFINITIES.get(secondary, []) if secondary else [])
+    ))
+    for primary in ElementType
+    for secondary in (None,) + tuple(ElementType)
+}
+
+_ELEMENT_PARTICLES = {
+    ElementType.FIRE: "flames",
+    ElementType.WATER: "water_drops",
+    ElementType.EARTH: "rocks",
+    ElementType.AIR: "wind_swirls",
+    ElementType.LIGHT: "sparkles",
+    ElementType.DARK: "shadows",
+    ElementType.ELECTRIC: "lightning",
+    ElementType.ICE: "snowflakes",
+    ElementType.NATURE: "leaves",
+    ElementType.PSYCHIC: "energy_rings",
+    ElementType.NEUTRAL: "stars"
+}
+
+_ELEMENT_COLORS = {
+    ElementType.FIRE: "#FF4500",      # Orange-red
+    ElementType.WATER: "#1E90FF",     # Dodger blue
+    ElementType.EARTH: "#8B4513",     # Saddle brown
+    ElementType.AIR: "#87CEEB",       # Sky blue
+    ElementType.LIGHT: "#FFD700",     # Gold
+    ElementType.DARK: "#4B0082",      # Indigo
+    ElementType.ELECTRIC: "#FFFF00",  # Yellow
+    ElementType.ICE: "#00FFFF",       # Cyan
+    ElementType.NATURE: "#228B22",    # Forest green
+    ElementType.PSYCHIC: "#FF00FF",   # Magenta
+    ElementType.NEUTRAL: "#808080"    # Gray
+}
+
+_ELEMENT_DESCRIPTIONS = {
+    ElementType.FIRE: "Burns with inner flame and passionate energy",
+    ElementType.WATER: "Flows gracefully with calm, adaptive nature",
+    ElementType.EARTH: "Stands firm with grounded, steady strength",
+    ElementType.AIR: "Dances on the wind with light, free spirit",
+    ElementType.LIGHT: "Radiates warmth and positive energy",
+    ElementType.DARK: "Moves through shadows with mysterious grace",
+    ElementType.ELECTRIC: "Crackles with energetic, unpredictable power",
+    ElementType.ICE: "Cool and calculated with crystalline beauty",
+    ElementType.NATURE: "Thrives with natural vitality and growth",
+    ElementType.PSYCHIC: "Thinks deeply with enhanced perception",
+    ElementType.NEUTRAL: "Balanced and adaptable to any situation"
+}
+
+# Interaction messages by interaction type, covering every ElementalInteraction
+_INTERACTION_MESSAGES = {
+    ElementalInteraction.SUPER_EFFECTIVE: (
+        "The elements resonate powerfully!",
+        "A surge of elemental energy!",
+        "The reaction is incredibly effective!"
+    ),
+    ElementalInteraction.EFFECTIVE: (
+        "The elements interact normally.",
+        "A balanced elemental exchange.",
+        "The elements coexist peacefully."
+    ),
+    ElementalInteraction.NOT_EFFECTIVE: (
+        "The elements clash weakly...",
+        "The reaction is subdued.",
+        "Not much happened..."
+    ),
+    ElementalInteraction.IMMUNE: (
+        "The elements interact.",
+    )
+}
+
+
+@lru_cache(maxsize=256)
+def _compute_modifiers(primary: ElementType, secondary: Optional[ElementType],
+                       power: float) -> Tuple[Tuple[str, float], ...]:
+    """
+    Merge the behavioral modifiers for an element combination.
+
+    Args:
+        primary: Primary element type
+        secondary: Optional secondary element
+        power: Elemental power multiplier
+
+    Returns:
+        Immutable (modifier name, multiplier) pairs
+    """
+    modifiers = _ELEMENT_BEHAVIORS.get(primary, {}).copy()
+
+    # Add secondary element influence (at 50% strength)
+    if secondary:
+        secondary_mods = _ELEMENT_BEHAVIORS.get(secondary, {})
+        for key, value in secondary_mods.items():
+            if key in modifiers:
+                # Average the two modifiers
+                modifiers[key] = (modifiers[key] + value) / 2
+            else:
+                # Add at reduced strength
+                modifiers[key] = 1.0 + (value - 1.0) * 0.5
+
+    # Apply elemental power multiplier (1.0, the default, leaves them unchanged)
+    if power != 1.0:
+        for key in modifiers:
+            modifiers[key] *= power
+
+    return tuple(modifiers.items())
+
+
 class ElementSystem:
     """
     Manages elemental types and their interactions.
@@ -57,23 +283,15 @@ class ElementSystem:
         Returns:
             Tuple of (multiplier, interaction_type)
         """
-        # Check primary element advantage
-        multiplier = 1.0
-        interaction = ElementalInteraction.EFFECTIVE
+        target_index = _ELEMENT_INDEX[target_element]
 
-        if target_element in ELEMENT_ADVANTAGES.get(self.primary_element, []):
-            multiplier *= 2.0
-            interaction = ElementalInteraction.SUPER_EFFECTIVE
-        elif self.primary_element in ELEMENT_ADVANTAGES.get(target_element, []):
-            multiplier *= 0.5
-            interaction = ElementalInteraction.NOT_EFFECTIVE
+        # Primary element decides the interaction type
+        multiplier = float(_PRIMARY_EFF[_ELEMENT_INDEX[self.primary_element], target_index])
+        interaction = _INTERACTION_BY_MULTIPLIER[multiplier]
 
         # Check secondary element if present
         if self.secondary_element:
-            if target_element in ELEMENT_ADVANTAGES.get(self.secondary_element, []):
-                multiplier *= 1.5  # Secondary element gives smaller bonus
-            elif self.secondary_element in ELEMENT_ADVANTAGES.get(target_element, []):
-                multiplier *= 0.75  # Secondary element gives smaller penalty
+            multiplier *= float(_SECONDARY_EFF[_ELEMENT_INDEX[self.secondary_element], target_index])
 
         return multiplier, interaction
 
@@ -84,103 +302,8 @@ class ElementSystem:
         Returns:
             Dictionary of modifier names to multipliers
         """
-        # Element-specific behavioral modifiers
-        element_behaviors = {
-            ElementType.FIRE: {
-                "energy_level": 1.3,
-                "aggression": 1.2,
-                "movement_speed": 1.2,
-                "patience": 0.7,
-                "warmth_preference": 1.5
-            },
-            ElementType.WATER: {
-                "emotional_stability": 1.3,
-                "adaptability": 1.4,
-                "calm_behavior": 1.3,
-                "flow_movement": 1.2,
-                "moisture_preference": 1.5
-            },
-            ElementType.EARTH: {
-                "stubbornness": 1.2,
-                "patience": 1.4,
-                "stability": 1.5,
-                "grounded_behavior": 1.3,
-                "solid_stance": 1.4
-            },
-            ElementType.AIR: {
-                "movement_speed": 1.4,
-                "curiosity": 1.3,
-                "lightness": 1.5,
-                "attention_span": 0.8,
-                "height_preference": 1.4
-            },
-            ElementType.LIGHT: {
-                "happiness_gain": 1.3,
-                "trust": 1.3,
-                "brightness": 1.5,
-                "optimism": 1.4,
-                "day_activity": 1.3
-            },
-            ElementType.DARK: {
-                "stealth": 1.5,
-                "independence": 1.3,
-                "night_activity": 1.4,
-                "mystery": 1.4,
-                "shadow_affinity": 1.5
-            },
-            ElementType.ELECTRIC: {
-                "energy_level": 1.5,
-                "reaction_speed": 1.4,
-                "unpredictability": 1.2,
-                "spark": 1.3,
-                "charged_behavior": 1.3
-            },
-            ElementType.ICE: {
-                "calm_behavior": 1.4,
-                "precision": 1.3,
-                "cold_resistance": 1.5,
-                "calculated_moves": 1.3,
-                "frost_affinity": 1.4
-            },
-            ElementType.NATURE: {
-                "growth_rate": 1.2,
-                "healing_factor": 1.3,
-                "natural_affinity": 1.5,
-                "outdoor_preference": 1.4,
-                "vitality": 1.3
-            },
-            ElementType.PSYCHIC: {
-                "intelligence": 1.4,
-                "learning_speed": 1.3,
-                "intuition": 1.5,
-                "mental_focus": 1.4,
-                "perception": 1.3
-            },
-            ElementType.NEUTRAL: {
-                "balance": 1.2,
-                "adaptability": 1.3,
-                "versatility": 1.4
-            }
-        }
-
-        modifiers = element_behaviors.get(self.primary_element, {}).copy()
-
-        # Add secondary element influence (at 50% strength)
-        if self.secondary_element:
-            secondary_mods = element_behaviors.get(self.secondary_element, {})
-            for key, value in secondary_mods.items():
-                if key in modifiers:
-                    # Average the two modifiers
-                    modifiers[key] = (modifiers[key] + value) / 2
-                else:
-                    # Add at reduced strength
-                    modifiers[key] = 1.0 + (value - 1.0) * 0.5
-
-        # Apply elemental power multiplier
-        for key in modifiers:
-            modifiers[key] *= self.elemental_power
-
-        return modifiers
+        return dict(_compute_modifiers(self.primary_element, self.secondary_element,
+                                       self.elemental_power))
 
     def get_preferred_tricks(self) -> List[str]:
         """
@@ -189,26 +312,7 @@ class ElementSystem:
         Returns:
             List of trick names with affinity bonus
         """
-        element_trick_affinities = {
-            ElementType.FIRE: ["dance", "jump", "spin"],
-            ElementType.WATER: ["fetch", "swim", "flow"],
-            ElementType.EARTH: ["sit", "stay", "guard"],
-            ElementType.AIR: ["jump", "fly", "spin"],
-            ElementType.LIGHT: ["shine", "dance", "greet"],
-            ElementType.DARK: ["hide", "stealth", "shadow"],
-            ElementType.ELECTRIC: ["zap", "quick", "spark"],
-            ElementType.ICE: ["freeze", "slide", "chill"],
-            ElementType.NATURE: ["grow", "heal", "bloom"],
-            ElementType.PSYCHIC: ["think", "predict", "sense"],
-            ElementType.NEUTRAL: []  # No specific preferences
-        }
-
-        preferred = element_trick_affinities.get(self.primary_element, []).copy()
-
-        if self.secondary_element:
-            preferred.extend(element_trick_affinities.get(self.secondary_element, []))
-
-        return list(set(preferred))  # Remove duplicates
+        return list(_PREFERRED_TRICKS[self.primary_element, self.secondary_element])
 
     def boost_elemental_power(self, amount: float = 0.1):
         """
@@ -226,21 +330,7 @@ class ElementSystem:
         Returns:
             Particle effect identifier
         """
-        element_particles = {
-            ElementType.FIRE: "flames",
-            ElementType.WATER: "water_drops",
-            ElementType.EARTH: "rocks",
-            ElementType.AIR: "wind_swirls",
-            ElementType.LIGHT: "sparkles",
-            ElementType.DARK: "shadows",
-            ElementType.ELECTRIC: "lightning",
-            ElementType.ICE: "snowflakes",
-            ElementType.NATURE: "leaves",
-            ElementType.PSYCHIC: "energy_rings",
-            ElementType.NEUTRAL: "stars"
-        }
-
-        return element_particles.get(self.primary_element, "stars")
+        return _ELEMENT_PARTICLES.get(self.primary_element, "stars")
 
     def get_element_color(self) -> str:
         """
@@ -249,42 +339,14 @@ class ElementSystem:
         Returns:
             Hex color code
         """
-        element_colors = {
-            ElementType.FIRE: "#FF4500",      # Orange-red
-            ElementType.WATER: "#1E90FF",     # Dodger blue
-            ElementType.EARTH: "#8B4513",     # Saddle brown
-            ElementType.AIR: "#87CEEB",       # Sky blue
-            ElementType.LIGHT: "#FFD700",     # Gold
-            ElementType.DARK: "#4B0082",      # Indigo
-            ElementType.ELECTRIC: "#FFFF00",  # Yellow
-            ElementType.ICE: "#00FFFF",       # Cyan
-            ElementType.NATURE: "#228B22",    # Forest green
-            ElementType.PSYCHIC: "#FF00FF",   # Magenta
-            ElementType.NEUTRAL: "#808080"    # Gray
-        }
-
-        return element_colors.get(self.primary_element, "#808080")
+        return _ELEMENT_COLORS.get(self.primary_element, "#808080")
 
     def get_element_description(self) -> str:
         """Get a description of the creature's element."""
-        descriptions = {
-            ElementType.FIRE: "Burns with inner flame and passionate energy",
-            ElementType.WATER: "Flows gracefully with calm, adaptive nature",
-            ElementType.EARTH: "Stands firm with grounded, steady strength",
-            ElementType.AIR: "Dances on the wind with light, free spirit",
-            ElementType.LIGHT: "Radiates warmth and positive energy",
-            ElementType.DARK: "Moves through shadows with mysterious grace",
-            ElementType.ELECTRIC: "Crackles with energetic, unpredictable power",
-            ElementType.ICE: "Cool and calculated with crystalline beauty",
-            ElementType.NATURE: "Thrives with natural vitality and growth",
-            ElementType.PSYCHIC: "Thinks deeply with enhanced perception",
-            ElementType.NEUTRAL: "Balanced and adaptable to any situation"
-        }
-
-        primary_desc = descriptions.get(self.primary_element, "Has a unique elemental nature")
+        primary_desc = _ELEMENT_DESCRIPTIONS.get(self.primary_element, "Has a unique elemental nature")
 
         if self.secondary_element:
-            secondary_desc = descriptions.get(self.secondary_element, "")
+            secondary_desc = _ELEMENT_DESCRIPTIONS.get(self.secondary_element, "")
             return f"{primary_desc}, with hints of {self.secondary_element.value} energy"
 
         return primary_desc
@@ -302,25 +364,7 @@ class ElementSystem:
         multiplier, interaction_type = self.get_effectiveness(other_element)
 
         # Generate interaction message
-        messages = {
-            ElementalInteraction.SUPER_EFFECTIVE: [
-                "The elements resonate powerfully!",
-                "A surge of elemental energy!",
-                "The reaction is incredibly effective!"
-            ],
-            ElementalInteraction.EFFECTIVE: [
-                "The elements interact normally.",
-                "A balanced elemental exchange.",
-                "The elements coexist peacefully."
-            ],
-            ElementalInteraction.NOT_EFFECTIVE: [
-                "The elements clash weakly...",
-                "The reaction is subdued.",
-                "Not much happened..."
-            ]
-        }
-
-        message = random.choice(messages.get(interaction_type, ["The elements interact."]))
+        message = random.choice(_INTERACTION_MESSAGES[interaction_type])
 
         # Calculate effects
         happiness_change = (multiplier - 1.0) * 10  # -5 to +10 happiness
@@ -6,8 +6,10 @@ Manages emotion-based visual particles (hearts, stars, sweat, etc.).
 import time
 import random
 import math
-from typing import Dict, Any, List, Optional, Tuple
+import numpy as np
+from typing import Dict, Any, Optional, Tuple
 from enum import Enum
+from .jit import njit
 
 
 class EmotionType(Enum):
@@ -29,9 +31,154 @@ class EmotionType(Enum):
     FOOD_ICONS = "food"            # Hungry, eating
 
 
+# EmotionType members in a fixed order; a particle's type code is its index
+_EMOTION_TYPES = tuple(EmotionType)
+_EMOTION_CODES = {emotion_type: code for code, emotion_type in enumerate(_EMOTION_TYPES)}
+
+# Rows of EmotionParticleEmitter._state, one per particle field
+(_X, _Y, _VX, _VY, _AGE, _LIFETIME, _SIZE,
+ _ROTATION, _ROTATION_SPEED, _ALPHA) = range(10)
+_PARTICLE_FIELDS = 10
+
+# Particle types that gravity pulls down
+_GRAVITY_TYPES = frozenset((EmotionType.TEARS, EmotionType.SWEAT, EmotionType.BROKEN_HEART))
+
+# Whether gravity pulls on each particle type, indexed by type code
+_GRAVITY_BY_CODE = np.array([emotion_type in _GRAVITY_TYPES for emotion_type in _EMOTION_TYPES])
+
+_INITIAL_CAPACITY = 64
+
+_TAU = 2 * math.pi
+
+# Emission behavior per particle type:
+# (vx range, vy range, lifetime range, size range,
+#  scale velocity by intensity, scale size by intensity, polar).
+# Fixed values are given as (v, v). Polar types emit in a random direction
+# with a speed drawn from the vx range; for the others only vy is scaled.
+_EMIT_PARAMS = {
+    # Float upward with gentle drift
+    EmotionType.HEARTS: ((-20, 20), (-60, -40), (1.5, 2.5), (0.8, 1.2), True, True, False),
+    # Burst outward
+    EmotionType.STARS: ((50, 100), None, (1.0, 2.0), (0.7, 1.3), True, True, True),
+    # Quick, small, upward
+    EmotionType.SPARKLES: ((-30, 30), (-80, -40), (0.5, 1.0), (0.4, 0.8), False, True, False),
+    # Drop down from head; starts stationary, gravity pulls down
+    EmotionType.SWEAT: ((-10, 10), (0, 0), (0.8, 1.5), (0.6, 1.0), False, False, False),
+    # Fall from eyes
+    EmotionType.TEARS: ((-5, 5), (0, 0), (1.0, 2.0), (0.5, 0.8), False, False, False),
+    # Pop up above head
+    EmotionType.ANGER_MARKS: ((-15, 15), (-40, -20), (1.0, 1.5), (0.8, 1.2), False, False, False),
+    # Float slowly upward
+    EmotionType.QUESTION_MARKS: ((-10, 10), (-30, -30), (2.0, 3.0), (1.0, 1.0), False, False, False),
+    # Quick pop
+    EmotionType.EXCLAMATION: ((-20, 20), (-60, -30), (0.8, 1.2), (1.2, 1.2), False, False, False),
+    # Slow diagonal drift
+    EmotionType.ZZZ: ((10, 30), (-20, -10), (2.0, 3.0), (0.6, 1.0), False, False, False),
+    # Bounce upward
+    EmotionType.MUSICAL_NOTES: ((-25, 25), (-70, -50), (1.5, 2.5), (0.7, 1.0), False, False, False),
+    # Fall with pieces
+    EmotionType.BROKEN_HEART: ((-30, 30), (-20, 0), (1.5, 2.5), (1.2, 1.2), False, False, False),
+    # Waft upward in curves
+    EmotionType.STINK_LINES: ((-10, 10), (-40, -25), (2.0, 3.0), (0.6, 1.0), False, False, False),
+    # Circle around head
+    EmotionType.DIZZY_STARS: ((20, 20), None, (2.0, 3.0), (0.8, 0.8), False, False, True),
+    # Quick flash
+    EmotionType.LIGHTNING: ((0, 0), (0, 0), (0.3, 0.6), (1.2, 1.8), False, False, False),
+    # Float toward mouth
+    EmotionType.FOOD_ICONS: ((-10, 10), (10, 30), (1.0, 1.5), (0.7, 1.0), False, False, False),
+}
+_DEFAULT_EMIT_PARAMS = ((-20, 20), (-50, -30), (2.0, 2.0), (1.0, 1.0), False, False, False)
+
+# Emissions of up to this many particles draw from the stdlib random module;
+# for so few values a NumPy Generator call costs more than it saves
+_SCALAR_EMIT_MAX = 4
+
+
+def _draw_particle(params: tuple, x: float, y: float, intensity: float) -> Tuple[float, ...]:
+    """
+    Draw one new particle with the stdlib random module.
+
+    Args:
+        params: Emission behavior entry from _EMIT_PARAMS
+        x, y: Spawn position
+        intensity: Intensity affects velocity and size
+
+    Returns:
+        Particle fields in row order (_X through _ALPHA)
+    """
+    (vx_range, vy_range, lifetime_range, size_range,
+     scale_velocity, scale_size, polar) = params
+
+    if polar:
+        # vx_range holds the speed; direction is random
+        angle = random.uniform(0, _TAU)
+        speed = random.uniform(*vx_range)
+        if scale_velocity:
+            speed *= intensity
+        vx = math.cos(angle) * speed
+        vy = math.sin(angle) * speed
+    else:
+        vx = random.uniform(*vx_range)
+        vy = random.uniform(*vy_range)
+        if scale_velocity:
+            vy *= intensity
+
+    lifetime = random.uniform(*lifetime_range)
+    size = random.uniform(*size_range)
+    if scale_size:
+        size *= intensity
+
+    return (
+        x + random.uniform(-10, 10),  # Slight spawn offset
+        y + random.uniform(-10, 10),
+        vx, vy,
+        0.0,                          # age
+        lifetime, size,
+        0.0,                          # rotation
+        random.uniform(-180, 180),    # rotation speed, degrees/sec
+        1.0                           # alpha
+    )
+
+
+@njit(cache=True)
+def _step_particles_vectorized(state: np.ndarray, types: np.ndarray,
+                               gravity_by_code: np.ndarray, dt: float):
+    """
+    Advance live particles by dt using whole-array operations.
+
+    Compiled by numba when it is installed; plain NumPy otherwise.
+
+    Args:
+        state: Live columns of EmotionParticleEmitter._state (updated in place)
+        types: Type codes of the live particles
+        gravity_by_code: Whether gravity applies, indexed by type code
+        dt: Time elapsed (seconds)
+    """
+    age = state[_AGE]
+    age += dt
+
+    # Update position
+    state[_X] += state[_VX] * dt
+    state[_Y] += state[_VY] * dt
+
+    # Apply gravity for some types
+    state[_VY] += gravity_by_code[types] * (100 * dt)
+
+    # Update rotation
+    state[_ROTATION] += state[_ROTATION_SPEED] * dt
+
+    # Fade out over the last 30% of life
+    state[_ALPHA] = np.minimum((1.0 - age / state[_LIFETIME]) / 0.3, 1.0)
+
+
 class EmotionParticle:
     """Represents a single emotion particle."""
 
+    __slots__ = (
+        'x', 'y', 'particle_type', 'vx', 'vy', 'lifetime', 'age', 'size',
+        'rotation', 'rotation_speed', 'alpha',
+    )
+
     def __init__(self, x: float, y: float, particle_type: EmotionType,
                  velocity: Tuple[float, float] = (0, 0),
                  lifetime: float = 2.0, size: float = 1.0):
@@ -58,25 +205,24 @@ class EmotionParticle:
 
     def update(self, dt: float):
         """Update particle position and state."""
-        self.age += dt
+        age = self.age + dt
+        vy = self.vy
 
         # Update position
         self.x += self.vx * dt
-        self.y += self.vy * dt
+        self.y += vy * dt
 
         # Apply gravity for some types
-        if self.particle_type in [EmotionType.TEARS, EmotionType.SWEAT, EmotionType.BROKEN_HEART]:
-            self.vy += 100 * dt  # Gravity
+        if self.particle_type in _GRAVITY_TYPES:
+            self.vy = vy + 100 * dt  # Gravity
 
         # Update rotation
         self.rotation += self.rotation_speed * dt
 
         # Fade out near end of life
-        life_remaining = 1.0 - (self.age / self.lifetime)
-        if life_remaining < 0.3:
-            self.alpha = life_remaining / 0.3
-        else:
-            self.alpha = 1.0
+        life_remaining = 1.0 - (age / self.lifetime)
+        self.alpha = life_remaining / 0.3 if life_remaining < 0.3 else 1.0
+        self.age = age
 
     def is_alive(self) -> bool:
         """Check if particle is still alive."""
@@ -96,14 +242,57 @@ class EmotionParticle:
         }
 
 
+class ActiveEmotion:
+    """Emission state of an emotion that is currently displayed."""
+
+    __slots__ = ('intensity', 'duration', 'elapsed')
+
+    def __init__(self, intensity: float, duration: float, elapsed: float = 0.0):
+        """
+        Initialize active emotion.
+
+        Args:
+            intensity: Intensity of emotion (0-1)
+            duration: How long to emit particles (seconds)
+            elapsed: Time already spent emitting (seconds)
+        """
+        self.intensity = intensity
+        self.duration = duration
+        self.elapsed = elapsed
+
+    def to_dict(self) -> Dict[str, float]:
+        """Serialize to dictionary."""
+        return {
+            'intensity': self.intensity,
+            'duration': self.duration,
+            'elapsed': self.elapsed
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, float]) -> 'ActiveEmotion':
+        """Deserialize from dictionary."""
+        return cls(
+            intensity=data.get('intensity', 1.0),
+            duration=data.get('duration', 2.0),
+            elapsed=data.get('elapsed', 0.0)
+        )
+
+
 class EmotionParticleEmitter:
     """Emits emotion particles based on pet state."""
 
     def __init__(self):
         """Initialize emotion particle emitter."""
-        self.particles: List[EmotionParticle] = []
-        self.active_emotions: Dict[EmotionType, float] = {}  # emotion: intensity
-        self.emission_cooldowns: Dict[EmotionType, float] = {}  # emission timers
+        # Live particles as a struct of arrays: one row per field (_X, _Y, ...)
+        # and one column per particle, with type codes in _types. Only the
+        # first _count columns are live; dead particles are dropped each update.
+        self._state = np.zeros((_PARTICLE_FIELDS, _INITIAL_CAPACITY))
+        self._types = np.zeros(_INITIAL_CAPACITY, dtype=np.uint8)
+        self._count = 0
+        self._rng = np.random.default_rng()
+
+        self.active_emotions: Dict[EmotionType, ActiveEmotion] = {}
+        self.emission_cooldowns = np.zeros(len(_EMOTION_TYPES))  # emission timers, by type code
 
         # Emission rates (particles per second at full intensity)
         self.emission_rates = {
@@ -128,6 +317,74 @@ class EmotionParticleEmitter:
         self.total_particles_emitted = 0
         self.particles_by_type: Dict[str, int] = {}
 
+    @property
+    def particles(self) -> Dict[str, np.ndarray]:
+        """Live particles as read-only column arrays (see render_view)."""
+        return self.render_view()
+
+    def _reserve(self, count: int):
+        """Grow the live arrays, keeping their contents, until they hold count particles."""
+        capacity = self._types.shape[0]
+        if count > capacity:
+            while capacity < count:
+                capacity *= 2
+            n = self._count
+            state = np.zeros((_PARTICLE_FIELDS, capacity))
+            state[:, :n] = self._state[:, :n]
+            types = np.zeros(capacity, dtype=np.uint8)
+            types[:n] = self._types[:n]
+            self._state = state
+            self._types = types
+
+    def _add_particle(self, code: int, fields: Tuple[float, ...]):
+        """Append one particle, given its fields in row order."""
+        index = self._count
+        self._reserve(index + 1)
+        self._state[:, index] = fields
+        self._types[index] = code
+        self._count = index + 1
+
+    def _add_particles(self, emotion_type: EmotionType, x: np.ndarray, y: np.ndarray,
+                       vx: np.ndarray, vy: np.ndarray, lifetime: np.ndarray, size: np.ndarray):
+        """Append a run of same-type particles."""
+        count = len(x)
+        code = _EMOTION_CODES[emotion_type]
+        start = self._count
+        end = start + count
+
+        self._reserve(end)
+        block = self._state[:, start:end]
+
+        block[_X] = x
+        block[_Y] = y
+        block[_VX] = vx
+        block[_VY] = vy
+        block[_AGE] = 0.0
+        block[_LIFETIME] = lifetime
+        block[_SIZE] = size
+        block[_ROTATION] = 0.0
+        block[_ROTATION_SPEED] = self._rng.uniform(-180, 180, count)  # degrees/sec
+        block[_ALPHA] = 1.0
+
+        self._types[start:end] = code
+        self._count = end
+
+    def _keep_particles(self, keep: np.ndarray):
+        """
+        Compact the live arrays in place down to the particles flagged in keep.
+
+        Survivors keep their order. Nothing is copied when all survive.
+
+        Args:
+            keep: Boolean mask over the live particles
+        """
+        n = self._count
+        survivors = int(np.count_nonzero(keep))
+        if survivors < n:
+            self._state[:, :survivors] = self._state[:, :n][:, keep]
+            self._types[:survivors] = self._types[:n][keep]
+            self._count = survivors
+
     def trigger_emotion(self, emotion_type: EmotionType, intensity: float = 1.0,
                        duration: float = 2.0):
         """
@@ -138,11 +395,10 @@ class EmotionParticleEmitter:
             intensity: Intensity of emotion (0-1)
             duration: How long to emit particles (seconds)
         """
-        self.active_emotions[emotion_type] = {
-            'intensity': max(0.0, min(1.0, intensity)),
-            'duration': duration,
-            'elapsed': 0.0
-        }
+        self.active_emotions[emotion_type] = ActiveEmotion(
+            intensity=max(0.0, min(1.0, intensity)),
+            duration=duration
+        )
 
     def emit_particle(self, emotion_type: EmotionType, position: Tuple[float, float],
                      intensity: float = 1.0):
@@ -154,143 +410,79 @@ class EmotionParticleEmitter:
             position: (x, y) spawn position
             intensity: Intensity affects velocity and size
         """
+        self.emit_particles_batch(emotion_type, 1, position, intensity)
+
+    def emit_particles_batch(self, emotion_type: EmotionType, count: int,
+                             position: Tuple[float, float], intensity: float = 1.0):
+        """
+        Emit several particles of one type.
+
+        Small counts (the usual per-frame case) are drawn one at a time with
+        the stdlib random module; larger bursts draw all random values at
+        once from the emitter's NumPy generator.
+
+        Args:
+            emotion_type: Type of particle
+            count: Number of particles to emit
+            position: (x, y) spawn position
+            intensity: Intensity affects velocity and size
+        """
+        if count <= 0:
+            return
+
         x, y = position
 
         # Determine particle behavior based on type
-        if emotion_type == EmotionType.HEARTS:
-            # Float upward with gentle drift
-            vx = random.uniform(-20, 20)
-            vy = random.uniform(-60, -40) * intensity
-            lifetime = random.uniform(1.5, 2.5)
-            size = random.uniform(0.8, 1.2) * intensity
-
-        elif emotion_type == EmotionType.STARS:
-            # Burst outward
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(50, 100) * intensity
-            vx = math.cos(angle) * speed
-            vy = math.sin(angle) * speed
-            lifetime = random.uniform(1.0, 2.0)
-            size = random.uniform(0.7, 1.3) * intensity
-
-        elif emotion_type == EmotionType.SPARKLES:
-            # Quick, small, upward
-            vx = random.uniform(-30, 30)
-            vy = random.uniform(-80, -40)
-            lifetime = random.uniform(0.5, 1.0)
-            size = random.uniform(0.4, 0.8) * intensity
-
-        elif emotion_type == EmotionType.SWEAT:
-            # Drop down from head
-            vx = random.uniform(-10, 10)
-            vy = 0  # Starts stationary, gravity pulls down
-            lifetime = random.uniform(0.8, 1.5)
-            size = random.uniform(0.6, 1.0)
-
-        elif emotion_type == EmotionType.TEARS:
-            # Fall from eyes
-            vx = random.uniform(-5, 5)
-            vy = 0
-            lifetime = random.uniform(1.0, 2.0)
-            size = random.uniform(0.5, 0.8)
-
-        elif emotion_type == EmotionType.ANGER_MARKS:
-            # Pop up above head
-            vx = random.uniform(-15, 15)
-            vy = random.uniform(-40, -20)
-            lifetime = random.uniform(1.0, 1.5)
-            size = random.uniform(0.8, 1.2)
-
-        elif emotion_type == EmotionType.QUESTION_MARKS:
-            # Float slowly upward
-            vx = random.uniform(-10, 10)
-            vy = -30
-            lifetime = random.uniform(2.0, 3.0)
-            size = 1.0
-
-        elif emotion_type == EmotionType.EXCLAMATION:
-            # Quick pop
-            vx = random.uniform(-20, 20)
-            vy = random.uniform(-60, -30)
-            lifetime = random.uniform(0.8, 1.2)
-            size = 1.2
-
-        elif emotion_type == EmotionType.ZZZ:
-            # Slow diagonal drift
-            vx = random.uniform(10, 30)
-            vy = random.uniform(-20, -10)
-            lifetime = random.uniform(2.0, 3.0)
-            size = random.uniform(0.6, 1.0)
-
-        elif emotion_type == EmotionType.MUSICAL_NOTES:
-            # Bounce upward
-            vx = random.uniform(-25, 25)
-            vy = random.uniform(-70, -50)
-            lifetime = random.uniform(1.5, 2.5)
-            size = random.uniform(0.7, 1.0)
-
-        elif emotion_type == EmotionType.BROKEN_HEART:
-            # Fall with pieces
-            vx = random.uniform(-30, 30)
-            vy = random.uniform(-20, 0)
-            lifetime = random.uniform(1.5, 2.5)
-            size = 1.2
-
-        elif emotion_type == EmotionType.STINK_LINES:
-            # Waft upward in curves
-            vx = random.uniform(-10, 10)
-            vy = random.uniform(-40, -25)
-            lifetime = random.uniform(2.0, 3.0)
-            size = random.uniform(0.6, 1.0)
-
-        elif emotion_type == EmotionType.DIZZY_STARS:
-            # Circle around head
-            angle = random.uniform(0, 2 * math.pi)
-            radius = 30
-            vx = math.cos(angle) * 20
-            vy = math.sin(angle) * 20
-            lifetime = random.uniform(2.0, 3.0)
-            size = 0.8
-
-        elif emotion_type == EmotionType.LIGHTNING:
-            # Quick flash
-            vx = 0
-            vy = 0
-            lifetime = random.uniform(0.3, 0.6)
-            size = random.uniform(1.2, 1.8)
-
-        elif emotion_type == EmotionType.FOOD_ICONS:
-            # Float toward mouth
-            vx = random.uniform(-10, 10)
-            vy = random.uniform(10, 30)
-            lifetime = random.uniform(1.0, 1.5)
-            size = random.uniform(0.7, 1.0)
+        params = _EMIT_PARAMS.get(emotion_type, _DEFAULT_EMIT_PARAMS)
 
+        if count <= _SCALAR_EMIT_MAX:
+            code = _EMOTION_CODES[emotion_type]
+            for _ in range(count):
+                self._add_particle(code, _draw_particle(params, x, y, intensity))
         else:
-            # Default behavior
-            vx = random.uniform(-20, 20)
-            vy = random.uniform(-50, -30)
-            lifetime = 2.0
-            size = 1.0
-
-        # Create and add particle
-        particle = EmotionParticle(
-            x=x + random.uniform(-10, 10),  # Slight spawn offset
-            y=y + random.uniform(-10, 10),
-            particle_type=emotion_type,
-            velocity=(vx, vy),
-            lifetime=lifetime,
-            size=size
-        )
+            self._emit_burst(emotion_type, params, count, x, y, intensity)
 
-        self.particles.append(particle)
-        self.total_particles_emitted += 1
+        self.total_particles_emitted += count
 
         # Track by type
         type_name = emotion_type.value
         if type_name not in self.particles_by_type:
             self.particles_by_type[type_name] = 0
-        self.particles_by_type[type_name] += 1
+        self.particles_by_type[type_name] += count
+
+    def _emit_burst(self, emotion_type: EmotionType, params: tuple, count: int,
+                    x: float, y: float, intensity: float):
+        """Emit count particles, drawing all random values at once from the NumPy generator."""
+        rng = self._rng
+        (vx_range, vy_range, lifetime_range, size_range,
+         scale_velocity, scale_size, polar) = params
+
+        if polar:
+            # vx_range holds the speed; direction is random
+            angle = rng.uniform(0, _TAU, count)
+            speed = rng.uniform(vx_range[0], vx_range[1], count)
+            if scale_velocity:
+                speed *= intensity
+            vx = np.cos(angle) * speed
+            vy = np.sin(angle) * speed
+        else:
+            vx = rng.uniform(vx_range[0], vx_range[1], count)
+            vy = rng.uniform(vy_range[0], vy_range[1], count)
+            if scale_velocity:
+                vy *= intensity
+
+        lifetime = rng.uniform(lifetime_range[0], lifetime_range[1], count)
+        size = rng.uniform(size_range[0], size_range[1], count)
+        if scale_size:
+            size *= intensity
+
+        # Add particles with a slight spawn offset
+        self._add_particles(
+            emotion_type,
+            x + rng.uniform(-10, 10, count),
+            y + rng.uniform(-10, 10, count),
+            vx, vy, lifetime, size
+        )
 
     def update(self, dt: float, pet_position: Tuple[float, float]):
         """
@@ -301,37 +493,39 @@ class EmotionParticleEmitter:
             pet_position: (x, y) position of pet center
         """
         # Update existing particles
-        for particle in self.particles[:]:
-            particle.update(dt)
-            if not particle.is_alive():
-                self.particles.remove(particle)
+        n = self._count
+        if n:
+            state = self._state[:, :n]
+            _step_particles_vectorized(state, self._types[:n], _GRAVITY_BY_CODE, float(dt))
+
+            # Drop dead particles
+            self._keep_particles(state[_AGE] < state[_LIFETIME])
 
         # Update active emotions and emit particles
-        for emotion_type, emotion_data in list(self.active_emotions.items()):
-            emotion_data['elapsed'] += dt
+        for emotion_type, emotion in list(self.active_emotions.items()):
+            emotion.elapsed += dt
 
             # Check if emotion expired
-            if emotion_data['elapsed'] >= emotion_data['duration']:
+            if emotion.elapsed >= emotion.duration:
                 del self.active_emotions[emotion_type]
                 continue
 
             # Update cooldown
-            if emotion_type not in self.emission_cooldowns:
-                self.emission_cooldowns[emotion_type] = 0.0
-
-            self.emission_cooldowns[emotion_type] += dt
+            code = _EMOTION_CODES[emotion_type]
+            self.emission_cooldowns[code] += dt
 
             # Emit particles based on rate and intensity
             emission_rate = self.emission_rates.get(emotion_type, 1.0)
-            intensity = emotion_data['intensity']
+            intensity = emotion.intensity
             particles_per_second = emission_rate * intensity
 
             interval = 1.0 / particles_per_second if particles_per_second > 0 else float('inf')
 
-            # Emit particles if cooldown expired
-            while self.emission_cooldowns[emotion_type] >= interval:
-                self.emission_cooldowns[emotion_type] -= interval
-                self.emit_particle(emotion_type, pet_position, intensity)
+            # Emit every particle whose interval has elapsed in one batch
+            count = int(self.emission_cooldowns[code] // interval)
+            if count:
+                self.emission_cooldowns[code] -= count * interval
+                self.emit_particles_batch(emotion_type, count, pet_position, intensity)
 
     def clear_particles(self, emotion_type: Optional[EmotionType] = None):
         """
@@ -340,24 +534,61 @@ class EmotionParticleEmitter:
         Args:
             emotion_type: If specified, only clear this type
         """
-        if emotion_type:
-            self.particles = [p for p in self.particles if p.particle_type != emotion_type]
+        if emotion_type is None:
+            self._count = 0
         else:
-            self.particles.clear()
+            self._keep_particles(self._types[:self._count] != _EMOTION_CODES[emotion_type])
 
-    def get_particles(self, emotion_type: Optional[EmotionType] = None) -> List[EmotionParticle]:
+    def get_particles(self, emotion_type: Optional[EmotionType] = None) -> Dict[str, np.ndarray]:
         """
-        Get active particles.
+        Get active particles as read-only column arrays.
 
         Args:
             emotion_type: If specified, only return this type
 
         Returns:
-            List of particles
+            Dictionary of field name to array, as from render_view
         """
-        if emotion_type:
-            return [p for p in self.particles if p.particle_type == emotion_type]
-        return self.particles.copy()
+        view = self.render_view()
+        if emotion_type is None:
+            return view
+
+        selected = view['type'] == _EMOTION_CODES[emotion_type]
+        particles = {}
+        for name, column in view.items():
+            column = column[selected]
+            column.flags.writeable = False
+            particles[name] = column
+        return particles
+
+    def render_view(self) -> Dict[str, np.ndarray]:
+        """
+        Get the live particles as read-only column arrays for rendering.
+
+        The arrays are views of the emitter's storage, so nothing is copied;
+        they are only valid until the next update, emit or clear.
+
+        Returns:
+            Dictionary of field name to array, one entry per live particle.
+            'type' holds type codes, which index into tuple(EmotionType).
+        """
+        n = self._count
+        state = self._state[:, :n]
+        view = {
+            'x': state[_X],
+            'y': state[_Y],
+            'vx': state[_VX],
+            'vy': state[_VY],
+            'type': self._types[:n],
+            'size': state[_SIZE],
+            'rotation': state[_ROTATION],
+            'alpha': state[_ALPHA],
+            'age': state[_AGE],
+            'lifetime': state[_LIFETIME]
+        }
+        for column in view.values():
+            column.flags.writeable = False
+        return view
 
     def get_particle_count(self, emotion_type: Optional[EmotionType] = None) -> int:
         """
@@ -370,20 +601,22 @@ class EmotionParticleEmitter:
             Particle count
         """
         if emotion_type:
-            return len([p for p in self.particles if p.particle_type == emotion_type])
-        return len(self.particles)
+            code = _EMOTION_CODES[emotion_type]
+            return int(np.count_nonzero(self._types[:self._count] == code))
+        return self._count
 
     def get_status(self) -> Dict[str, Any]:
         """Get emotion particle system status."""
+        # Count every type in one pass over the live type codes
+        counts = np.bincount(self._types[:self._count], minlength=len(_EMOTION_TYPES)).tolist()
         return {
-            'active_particles': len(self.particles),
+            'active_particles': self._count,
             'active_emotions': len(self.active_emotions),
             'emotion_types': [e.value for e in self.active_emotions.keys()],
             'total_emitted': self.total_particles_emitted,
             'particles_by_type': self.particles_by_type.copy(),
             'particles_breakdown': {
-                ptype.value: self.get_particle_count(ptype)
-                for ptype in EmotionType
+                ptype.value: count for ptype, count in zip(_EMOTION_TYPES, counts)
             }
         }
 
@@ -393,7 +626,8 @@ class EmotionParticleEmitter:
             'total_particles_emitted': self.total_particles_emitted,
             'particles_by_type': self.particles_by_type.copy(),
             'active_emotions': {
-                emotion.value: data for emotion, data in self.active_emotions.items()
+                emotion_type.value: emotion.to_dict()
+                for emotion_type, emotion in self.active_emotions.items()
             }
         }
 
@@ -408,6 +642,6 @@ class EmotionParticleEmitter:
         active_emotions = data.get('active_emotions', {})
         for emotion_str, emotion_data in active_emotions.items():
             emotion_type = EmotionType(emotion_str)
-            emitter.active_emotions[emotion_type] = emotion_data
+            emitter.active_emotions[emotion_type] = ActiveEmotion.from_dict(emotion_data)
 
         return emitter
@@ -6,6 +6,7 @@ These emotional states are influenced by bonding level and recent experiences.
 """
 from typing import Dict, Any, Optional, Tuple, List
 from enum import Enum
+import heapq
 import time
 import numpy as np
 
@@ -22,6 +23,39 @@ class EmotionalState(Enum):
     YEARNING = "yearning"                  # Wanting more attention
 
 
+# How strongly each state at full intensity raises (+) or lowers (-) the
+# behavior modifiers it affects, in the order the effects are applied
+_STATE_MODIFIER_EFFECTS = (
+    (EmotionalState.JEALOUS, (
+        ('happiness_modifier', -0.3),
+        ('attention_seeking', 0.8),
+        ('irritability', 0.5)
+    )),
+    (EmotionalState.SEPARATION_ANXIETY, (
+        ('happiness_modifier', -0.5),
+        ('activity_level', -0.4),
+        ('clinginess', 1.0)
+    )),
+    (EmotionalState.EXCITED_RETURN, (
+        ('happiness_modifier', 0.5),
+        ('activity_level', 0.6),
+        ('attention_seeking', 1.0)
+    )),
+    (EmotionalState.LONGING, (
+        ('happiness_modifier', -0.4),
+        ('activity_level', -0.3)
+    )),
+    (EmotionalState.POSSESSIVE, (
+        ('clinginess', 0.7),
+        ('irritability', 0.4)
+    )),
+    (EmotionalState.INSECURE, (
+        ('attention_seeking', 0.6),
+        ('clinginess', 0.5)
+    ))
+)
+
+
 class EmotionalStateManager:
     """
     Manages complex emotional states that emerge from bonding and experiences.
@@ -37,6 +71,11 @@ class EmotionalStateManager:
     def __init__(self):
         """Initialize emotional state manager."""
         self.current_states = {}  # {state: (intensity, expires_at)}
+        # Min-heap of (expires_at, seq, state) so update only visits expired
+        # states. Entries for removed or re-set states are left in place and
+        # skipped when popped; seq breaks ties between equal expiry times.
+        self._expiry_heap: List[Tuple[float, int, EmotionalState]] = []
+        self._expiry_seq = 0
         self.state_history = []
         self.last_owner_seen = time.time()
         self.owner_present = True
@@ -64,7 +103,7 @@ class EmotionalStateManager:
             duration: How long state lasts in seconds
         """
         expires_at = time.time() + duration
-        self.current_states[state] = (intensity, expires_at)
+        self._store_state(state, intensity, expires_at)
 
         # Record in history
         self.state_history.append({
@@ -77,48 +116,77 @@ class EmotionalStateManager:
         if len(self.state_history) > 100:
             self.state_history = self.state_history[-100:]
 
+    def _store_state(self, state: EmotionalState, intensity: float, expires_at: float):
+        """Record a state and schedule its expiry."""
+        self.current_states[state] = (intensity, expires_at)
+
+        heap = self._expiry_heap
+        if len(heap) > 4 * len(self.current_states) + 16:
+            # Mostly stale entries; rebuild from the live states
+            heap[:] = [(entry[1], seq, live_state) for seq, (live_state, entry)
+                       in enumerate(self.current_states.items())]
+            heapq.heapify(heap)
+            self._expiry_seq = len(heap)
+        else:
+            heapq.heappush(heap, (expires_at, self._expiry_seq, state))
+            self._expiry_seq += 1
+
     def remove_emotional_state(self, state: EmotionalState):
         """Remove an emotional state."""
         if state in self.current_states:
             del self.current_states[state]
 
-    def has_state(self, state: EmotionalState) -> bool:
-        """Check if currently in an emotional state."""
-        if state not in self.current_states:
-            return False
+    def _active_entry(self, state: EmotionalState, now: float) -> Optional[Tuple[float, float]]:
+        """
+        Get the (intensity, expires_at) entry of a state if it is active.
+
+        Expired entries are removed on the way.
+
+        Args:
+            state: The emotional state
+            now: Current time
+
+        Returns:
+            The entry, or None if the state is not active
+        """
+        entry = self.current_states.get(state)
+        if entry is None:
+            return None
 
         # Check if expired
-        intensity, expires_at = self.current_states[state]
-        if time.time() > expires_at:
+        if now > entry[1]:
             del self.current_states[state]
-            return False
+            return None
 
-        return True
+        return entry
 
-    def get_state_intensity(self, state: EmotionalState) -> float:
-        """Get intensity of a state (0 if not active)."""
-        if not self.has_state(state):
-            return 0.0
+    def has_state(self, state: EmotionalState, now: Optional[float] = None) -> bool:
+        """Check if currently in an emotional state."""
+        return self._active_entry(state, time.time() if now is None else now) is not None
 
-        intensity, _ = self.current_states[state]
-        return intensity
+    def get_state_intensity(self, state: EmotionalState, now: Optional[float] = None) -> float:
+        """Get intensity of a state (0 if not active)."""
+        entry = self._active_entry(state, time.time() if now is None else now)
+        return entry[0] if entry else 0.0
 
-    def update(self, delta_time: float):
+    def update(self, delta_time: float, now: Optional[float] = None):
         """
         Update emotional states (remove expired ones).
 
         Args:
             delta_time: Time since last update in seconds
+            now: Current time (e.g. the frame timestamp); looked up if None
         """
-        current_time = time.time()
-        expired_states = []
+        current_time = time.time() if now is None else now
+        heap = self._expiry_heap
 
-        for state, (intensity, expires_at) in self.current_states.items():
-            if current_time > expires_at:
-                expired_states.append(state)
+        while heap and heap[0][0] < current_time:
+            expires_at, _, state = heapq.heappop(heap)
 
-        for state in expired_states:
-            del self.current_states[state]
+            # Skip entries for states since removed or set again
+            entry = self.current_states.get(state)
+            if entry is not None and entry[1] == expires_at:
+                del self.current_states[state]
 
     def trigger_jealousy(self, bond_level: float, trigger_intensity: float = 0.5):
         """
@@ -302,52 +370,92 @@ class EmotionalStateManager:
             # Owner just left
             self.time_owner_left = time.time()
 
-    def get_current_states(self) -> Dict[str, float]:
+    def apply_owner_return(self, bond_level: float, trust_level: float,
+                           hours_away: float) -> Dict[str, float]:
+        """
+        Handle the owner coming back: reunion excitement plus presence update.
+
+        Args:
+            bond_level: Current bond level (0-100)
+            trust_level: Current trust level (0-100)
+            hours_away: How many hours owner was gone
+
+        Returns:
+            Dictionary describing the reunion, suitable for memory recording
+        """
+        self.trigger_excited_return(bond_level, hours_away)
+        self.set_owner_presence(True, bond_level, trust_level)
+
+        return {
+            'hours_away': hours_away,
+            'bond_level': bond_level,
+            'excitement_level': self.reunion_excitement_level
+        }
+
+    def get_current_states(self, now: Optional[float] = None) -> Dict[str, float]:
         """
         Get all currently active emotional states.
 
+        Args:
+            now: Current time; looked up if None
+
         Returns:
             Dictionary of {state_name: intensity}
         """
+        if now is None:
+            now = time.time()
+
         states = {}
         for state in list(self.current_states.keys()):
-            if self.has_state(state):
-                states[state.value] = self.get_state_intensity(state)
+            entry = self._active_entry(state, now)
+            if entry:
+                states[state.value] = entry[0]
 
         return states
 
-    def get_dominant_state(self) -> Optional[Tuple[EmotionalState, float]]:
+    def get_dominant_state(self, now: Optional[float] = None) -> Optional[Tuple[EmotionalState, float]]:
         """
         Get the most intense current emotional state.
 
+        Args:
+            now: Current time; looked up if None
+
         Returns:
             Tuple of (state, intensity) or None
         """
         if not self.current_states:
             return None
 
+        if now is None:
+            now = time.time()
+
         max_intensity = 0
         dominant_state = None
 
-        for state in self.current_states:
-            if self.has_state(state):
-                intensity = self.get_state_intensity(state)
-                if intensity > max_intensity:
-                    max_intensity = intensity
-                    dominant_state = state
+        for state in list(self.current_states.keys()):
+            entry = self._active_entry(state, now)
+            if entry and entry[0] > max_intensity:
+                max_intensity = entry[0]
+                dominant_state = state
 
         if dominant_state:
             return dominant_state, max_intensity
 
         return None
 
-    def get_behavioral_modifiers(self) -> Dict[str, float]:
+    def get_behavioral_modifiers(self, now: Optional[float] = None) -> Dict[str, float]:
         """
         Get behavioral modifiers based on current emotional states.
 
+        Args:
+            now: Current time; looked up if None
+
         Returns:
             Dictionary of behavior modifiers
         """
+        if now is None:
+            now = time.time()
+
         modifiers = {
             'happiness_modifier': 1.0,
             'activity_level': 1.0,
@@ -356,56 +464,28 @@ class EmotionalStateManager:
             'irritability': 1.0
         }
 
-        # Jealousy effects
-        if self.has_state(EmotionalState.JEALOUS):
-            intensity = self.get_state_intensity(EmotionalState.JEALOUS)
-            modifiers['happiness_modifier'] *= (1.0 - intensity * 0.3)
-            modifiers['attention_seeking'] *= (1.0 + intensity * 0.8)
-            modifiers['irritability'] *= (1.0 + intensity * 0.5)
-
-        # Separation anxiety effects
-        if self.has_state(EmotionalState.SEPARATION_ANXIETY):
-            intensity = self.get_state_intensity(EmotionalState.SEPARATION_ANXIETY)
-            modifiers['happiness_modifier'] *= (1.0 - intensity * 0.5)
-            modifiers['activity_level'] *= (1.0 - intensity * 0.4)
-            modifiers['clinginess'] *= (1.0 + intensity)
-
-        # Excited return effects
-        if self.has_state(EmotionalState.EXCITED_RETURN):
-            intensity = self.get_state_intensity(EmotionalState.EXCITED_RETURN)
-            modifiers['happiness_modifier'] *= (1.0 + intensity * 0.5)
-            modifiers['activity_level'] *= (1.0 + intensity * 0.6)
-            modifiers['attention_seeking'] *= (1.0 + intensity)
-
-        # Longing effects
-        if self.has_state(EmotionalState.LONGING):
-            intensity = self.get_state_intensity(EmotionalState.LONGING)
-            modifiers['happiness_modifier'] *= (1.0 - intensity * 0.4)
-            modifiers['activity_level'] *= (1.0 - intensity * 0.3)
-
-        # Possessive effects
-        if self.has_state(EmotionalState.POSSESSIVE):
-            intensity = self.get_state_intensity(EmotionalState.POSSESSIVE)
-            modifiers['clinginess'] *= (1.0 + intensity * 0.7)
-            modifiers['irritability'] *= (1.0 + intensity * 0.4)
-
-        # Insecurity effects
-        if self.has_state(EmotionalState.INSECURE):
-            intensity = self.get_state_intensity(EmotionalState.INSECURE)
-            modifiers['attention_seeking'] *= (1.0 + intensity * 0.6)
-            modifiers['clinginess'] *= (1.0 + intensity * 0.5)
+        # Each active state scales the modifiers it affects by
+        # (1 + coefficient * intensity)
+        if self.current_states:
+            for state, effects in _STATE_MODIFIER_EFFECTS:
+                entry = self._active_entry(state, now)
+                if entry:
+                    intensity = entry[0]
+                    for name, coefficient in effects:
+                        modifiers[name] *= 1.0 + intensity * coefficient
 
         return modifiers
 
     def get_stats(self) -> Dict[str, Any]:
         """Get emotional state statistics."""
+        now = time.time()
         return {
-            'current_states': self.get_current_states(),
+            'current_states': self.get_current_states(now),
             'owner_present': self.owner_present,
             'times_experienced_separation': self.times_experienced_separation,
             'longest_separation_hours': self.longest_separation / 3600,
             'attention_to_others_score': self.attention_to_others_score,
-            'behavioral_modifiers': self.get_behavioral_modifiers()
+            'behavioral_modifiers': self.get_behavioral_modifiers(now)
         }
 
     def to_dict(self) -> Dict[str, Any]:
@@ -439,10 +519,7 @@ class EmotionalStateManager:
         # Restore current states
         for state_name, state_data in data.get('current_states', {}).items():
             state = EmotionalState(state_name)
-            manager.current_states[state] = (
-                state_data['intensity'],
-                state_data['expires_at']
-            )
+            manager._store_state(state, state_data['intensity'], state_data['expires_at'])
 
         manager.state_history = data.get('state_history', [])
         manager.last_owner_seen = data.get('last_owner_seen', time.time())
@@ -9,7 +9,7 @@ Provides different AI complexity levels:
 """
 import numpy as np
 from typing import Dict, Any, Optional
-from .config import AIComplexity, DEFAULT_AI_COMPLEXITY
+from .config import AIComplexity, DEFAULT_AI_COMPLEXITY, PersonalityType
 from .neural_network import NeuralNetwork, BehaviorLearner as SimpleBehaviorLearner
 from .advanced_network import AdvancedNeuralNetwork
 from .lstm_network import LSTMNetwork
@@ -17,6 +17,16 @@ from .specialized_networks import NetworkCoordinator
 from .sensory_system import CompleteSensorySystem
 from .reinforcement_learning import GoalOrientedBehaviorSystem
 
+# Complexity levels that decide without the network coordinator
+_LIGHTWEIGHT_COMPLEXITIES = frozenset((AIComplexity.SIMPLE, AIComplexity.MEDIUM))
+
+# One-hot personality encodings, built once
+_PERSONALITY_ENCODINGS = {
+    personality: [1.0 if other is personality else 0.0 for other in PersonalityType]
+    for personality in PersonalityType
+}
+_UNKNOWN_PERSONALITY_ENCODING = [0.0] * len(PersonalityType)
+
 
 class EnhancedBehaviorLearner:
     """
@@ -157,17 +167,8 @@ class EnhancedBehaviorLearner:
 
     def _encode_personality(self) -> list:
         """Encode personality as one-hot vector."""
-        from .config import PersonalityType
-        personalities = list(PersonalityType)
-        encoding = [0.0] * len(personalities)
-
-        try:
-            idx = personalities.index(self.creature.personality)
-            encoding[idx] = 1.0
-        except (ValueError, AttributeError):
-            pass
-
-        return encoding
+        personality = getattr(self.creature, 'personality', None)
+        return list(_PERSONALITY_ENCODINGS.get(personality, _UNKNOWN_PERSONALITY_ENCODING))
 
     def choose_activity(self) -> str:
         """
@@ -225,18 +226,12 @@ class EnhancedBehaviorLearner:
             return [0.5] * 10
 
         recent = self.creature.interaction_history[-10:]
-        quality = []
 
-        for interaction in recent:
-            # Calculate quality based on positive feedback
-            q = 1.0 if interaction.get('positive', False) else 0.3
-            quality.append(q)
+        # Calculate quality based on positive feedback
+        quality = [1.0 if interaction.positive else 0.3 for interaction in recent]
 
         # Pad if needed
-        while len(quality) < 10:
-            quality.append(0.5)
-
-        return quality[:10]
+        return quality + [0.5] * (10 - len(quality))
 
     def learn_from_interaction(self, activity_type: str, enjoyed: bool, outcome: Dict[str, Any] = None):
         """
@@ -310,7 +305,7 @@ class EnhancedBehaviorLearner:
         Returns:
             Dictionary with activity, movement, emotional state, etc.
         """
-        if self.complexity in [AIComplexity.SIMPLE, AIComplexity.MEDIUM]:
+        if self.complexity in _LIGHTWEIGHT_COMPLEXITIES:
             # Simplified decision
             activity = self.choose_activity()
             return {
@@ -0,0 +1,19 @@
+"""
+Optional Numba JIT support.
+
+Numba is not a required dependency. When it is installed, numeric hot-path
+kernels decorated with njit are compiled to native code; otherwise the
+decorator is a no-op and the kernels run as plain Python.
+"""
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Fallback decorator used when numba is not installed."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
@@ -19,6 +19,11 @@ from datetime import datetime, timedelta
 from enum import Enum
 
 
+# Creature stat snapshots are recorded as flat detail keys rather than a
+# nested 'stats' dict
+STAT_SNAPSHOT_KEYS = ('stats_hunger', 'stats_happiness', 'stats_energy')
+
+
 class MemoryImportance(Enum):
     """How important a memory is for retention."""
     TRIVIAL = 0.1      # Forgotten quickly
@@ -361,6 +366,10 @@ class EnhancedWorkingMemory:
         self.capacity = capacity
         self.interactions = deque(maxlen=capacity)
 
+        # The same interactions bucketed by type, oldest first, so type
+        # queries don't scan the whole window
+        self._by_type: Dict[Optional[str], deque] = {}
+
     def add_interaction(self, interaction: Dict[str, Any]):
         """
         Add an interaction to working memory.
@@ -369,7 +378,19 @@ class EnhancedWorkingMemory:
             interaction: Dictionary with interaction details
         """
         interaction['timestamp'] = time.time()
+        self._append(interaction)
+
+    def _append(self, interaction: Dict[str, Any]):
+        """Append an interaction, evicting the oldest one from its type bucket too."""
+        if self.interactions and len(self.interactions) == self.interactions.maxlen:
+            evicted_type = self.interactions[0].get('type')
+            bucket = self._by_type[evicted_type]
+            bucket.popleft()
+            if not bucket:
+                del self._by_type[evicted_type]
+
         self.interactions.append(interaction)
+        self._by_type.setdefault(interaction.get('type'), deque()).append(interaction)
 
     def get_recent_interactions(self, count: int = 10) -> List[Dict[str, Any]]:
         """
@@ -394,8 +415,10 @@ class EnhancedWorkingMemory:
         Returns:
             List of matching interactions
         """
-        matching = [i for i in self.interactions if i.get('type') == interaction_type]
-        return matching[-limit:]
+        matching = self._by_type.get(interaction_type)
+        if not matching:
+            return []
+        return list(matching)[-limit:]
 
     def get_interaction_sequence(self, length: int = 50) -> List[Dict[str, Any]]:
         """
@@ -412,6 +435,7 @@ class EnhancedWorkingMemory:
     def clear(self):
         """Clear all working memory."""
         self.interactions.clear()
+        self._by_type.clear()
 
     def to_dict(self) -> Dict[str, Any]:
         """Serialize working memory."""
@@ -425,7 +449,7 @@ class EnhancedWorkingMemory:
         """Deserialize working memory."""
         memory = cls(capacity=data['capacity'])
         for interaction in data['interactions']:
-            memory.interactions.append(interaction)
+            memory._append(interaction)
         return memory
 
 
@@ -488,6 +512,10 @@ class MemoryConsolidation:
                     'context': interaction.get('context', {}),
                     'outcome': interaction.get('outcome', 'neutral')
                 }
+                source_details = interaction.get('details', {})
+                for key in STAT_SNAPSHOT_KEYS:
+                    if key in source_details:
+                        details[key] = source_details[key]
 
                 emotional_valence = 0.7 if interaction.get('positive', True) else 0.3
 
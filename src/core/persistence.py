@@ -14,6 +14,39 @@ from .creature import Creature
 from .enhanced_behavior_learner import EnhancedBehaviorLearner
 from .config import DATA_FILE
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _encode_save(data: Dict[str, Any]) -> bytes:
+    """
+    Encode save data as indented UTF-8 JSON.
+
+    Uses orjson when it is installed, which is several times faster than the
+    standard library encoder on the nested network state.
+
+    Args:
+        data: Save data to encode
+
+    Returns:
+        Encoded JSON bytes
+    """
+    if orjson is not None:
+        return orjson.dumps(
+            data,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        )
+    return json.dumps(data, indent=2).encode('utf-8')
+
+
+def _decode_save(raw: bytes) -> Any:
+    """Decode save data written by _encode_save (or the stdlib fallback)."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
 
 class PetDataManager:
     """Manages saving and loading of pet data with sophisticated AI systems."""
@@ -52,8 +85,9 @@ class PetDataManager:
         os.makedirs(os.path.dirname(self.data_file) if os.path.dirname(self.data_file) else '.', exist_ok=True)
 
         try:
-            with open(self.data_file, 'w') as f:
-                json.dump(data, f, indent=2)
+            encoded = _encode_save(data)
+            with open(self.data_file, 'wb') as f:
+                f.write(encoded)
         except Exception as e:
             print(f"Error saving pet data: {e}")
             # Try to save a backup without indent (might help with large files)
@@ -79,8 +113,8 @@ class PetDataManager:
             return None
 
         try:
-            with open(self.data_file, 'r') as f:
-                data = json.load(f)
+            with open(self.data_file, 'rb') as f:
+                data = _decode_save(f.read())
 
             result = {
                 'game_state': data.get('game_state', {}),
@@ -246,7 +246,7 @@ class PetManager:
         delta_time = current_time - self.last_update_time
         self.last_update_time = current_time
 
-        self.creature.update(delta_time)
+        self.creature.update(delta_time, current_time)
 
         # Check if creature is starving
         if self.creature.is_starving():
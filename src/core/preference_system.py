@@ -7,6 +7,11 @@ Preferences are learned through experience and influenced by personality.
 from typing import Dict, Any, Optional, Tuple, List
 import random
 import numpy as np
+from .config import ACTIVITY_TYPES, PREFERENCE_INITIAL
+
+# Fixed slot layout for activity preference scores (see activity_scores)
+ACTIVITY_SLOTS = tuple(ACTIVITY_TYPES)
+_ACTIVITY_SLOT_INDEX = {name: i for i, name in enumerate(ACTIVITY_SLOTS)}
 
 
 class PreferenceCategory(str):
@@ -18,6 +23,15 @@ class PreferenceCategory(str):
     INTERACTION_TYPE = "interaction_type"
 
 
+# Attribute holding the preference scores for each category
+_PREFERENCE_DICT_ATTRS = {
+    PreferenceCategory.TOY: 'toy_preferences',
+    PreferenceCategory.FOOD: 'food_preferences',
+    PreferenceCategory.ACTIVITY: 'activity_preferences',
+    PreferenceCategory.INTERACTION_TYPE: 'interaction_preferences',
+}
+
+
 class PreferenceSystem:
     """
     Manages individual preferences that develop over time.
@@ -49,6 +63,10 @@ class PreferenceSystem:
         self.toy_preferences = {}
         self.food_preferences = {}
         self.activity_preferences = {}
+
+        # Activity scores in ACTIVITY_SLOTS order, mirrored from activity_preferences
+        self.activity_scores = np.full(len(ACTIVITY_SLOTS), PREFERENCE_INITIAL)
+
         self.time_preferences = {
             'morning': 50,
             'afternoon': 50,
@@ -70,6 +88,9 @@ class PreferenceSystem:
         self.favorite_food = None
         self.least_favorite_food = None
 
+        # Bumped on every preference change so callers can cache derived views
+        self.version = 0
+
         # Initialize based on personality
         if personality_type:
             self._initialize_personality_preferences(personality_type)
@@ -108,6 +129,7 @@ class PreferenceSystem:
             if 'activity_preferences' in biases:
                 for activity, value in biases['activity_preferences'].items():
                     self.activity_preferences[activity] = value
+                self._sync_activity_scores()
 
             # Apply interaction preference biases
             if 'interaction_preferences' in biases:
@@ -174,20 +196,35 @@ class PreferenceSystem:
         new_pref = max(0, min(100, current + change))
         pref_dict[item] = new_pref
 
+        if pref_dict is self.activity_preferences and item in _ACTIVITY_SLOT_INDEX:
+            self.activity_scores[_ACTIVITY_SLOT_INDEX[item]] = new_pref
+
         # Update favorites
         self._update_favorites(category)
+        self.version += 1
+
+    def _sync_activity_scores(self):
+        """Rebuild activity_scores from the activity_preferences dict."""
+        self.activity_scores.fill(PREFERENCE_INITIAL)
+        for activity, score in self.activity_preferences.items():
+            if activity in _ACTIVITY_SLOT_INDEX:
+                self.activity_scores[_ACTIVITY_SLOT_INDEX[activity]] = score
+
+    def get_preferred_activity(self) -> Optional[str]:
+        """
+        Get the highest scoring activity slot.
+
+        Returns:
+            Activity name, or None if no activity has been rated yet
+        """
+        if not self.activity_preferences:
+            return None
+        return ACTIVITY_SLOTS[int(self.activity_scores.argmax())]
 
     def _get_preference_dict(self, category: str) -> Optional[Dict[str, float]]:
         """Get the appropriate preference dictionary for a category."""
-        if category == PreferenceCategory.TOY:
-            return self.toy_preferences
-        elif category == PreferenceCategory.FOOD:
-            return self.food_preferences
-        elif category == PreferenceCategory.ACTIVITY:
-            return self.activity_preferences
-        elif category == PreferenceCategory.INTERACTION_TYPE:
-            return self.interaction_preferences
-        return None
+        attr = _PREFERENCE_DICT_ATTRS.get(category)
+        return getattr(self, attr) if attr else None
 
     def _update_favorites(self, category: str):
         """Update favorite and least favorite for a category."""
@@ -380,6 +417,7 @@ class PreferenceSystem:
         system.toy_preferences = data.get('toy_preferences', {})
         system.food_preferences = data.get('food_preferences', {})
         system.activity_preferences = data.get('activity_preferences', {})
+        system._sync_activity_scores()
         system.time_preferences = data.get('time_preferences', system.time_preferences)
         system.interaction_preferences = data.get('interaction_preferences', system.interaction_preferences)
         system.experiences = data.get('experiences', [])
@@ -49,24 +49,7 @@ class MovementNetwork:
         Returns:
             (velocity_x, velocity_y, should_move)
         """
-        # Encode state
-        input_vector = np.array([
-            state.get('pos_x', 0) / 1920,  # Normalize to screen size
-            state.get('pos_y', 0) / 1080,
-            state.get('target_x', 0) / 1920,
-            state.get('target_y', 0) / 1080,
-            state.get('energy', 100) / 100,
-            min(1.0, state.get('distance_to_target', 0) / 500),
-            # Edge distances (normalized)
-            state.get('edge_top', 0) / 1080,
-            state.get('edge_bottom', 0) / 1080,
-            state.get('edge_left', 0) / 1920,
-            state.get('edge_right', 0) / 1920,
-            # Personality (one-hot or distributed encoding)
-            *state.get('personality_vector', [0] * 8)
-        ])
-
-        output = self.network.predict(input_vector)
+        output = self.network.predict(self._encode_state(state))
 
         # Decode output
         velocity_x = (output[0][0] - 0.5) * 10  # -5 to +5
@@ -85,31 +68,36 @@ class MovementNetwork:
             action: Action taken (velocity_x, velocity_y, should_move)
             reward: Reward received
         """
-        # Encode input
-        input_vector = np.array([
-            state.get('pos_x', 0) / 1920,
+        input_vector = self._encode_state(state)
+
+        # Target based on action and reward
+        velocity_x, velocity_y, should_move = action
+        target = np.array([[
+            (velocity_x / 10 + 0.5) * reward,  # Scale by reward
+            (velocity_y / 10 + 0.5) * reward,
+            1.0 if (should_move and reward > 0.5) else 0.0
+        ]])
+
+        self.network.train_step(input_vector, target)
+
+    def _encode_state(self, state: Dict[str, Any]) -> np.ndarray:
+        """Encode state for movement network."""
+        return np.array([
+            state.get('pos_x', 0) / 1920,  # Normalize to screen size
             state.get('pos_y', 0) / 1080,
             state.get('target_x', 0) / 1920,
             state.get('target_y', 0) / 1080,
             state.get('energy', 100) / 100,
             min(1.0, state.get('distance_to_target', 0) / 500),
+            # Edge distances (normalized)
             state.get('edge_top', 0) / 1080,
             state.get('edge_bottom', 0) / 1080,
             state.get('edge_left', 0) / 1920,
             state.get('edge_right', 0) / 1920,
+            # Personality (one-hot or distributed encoding)
             *state.get('personality_vector', [0] * 8)
         ])
 
-        # Target based on action and reward
-        velocity_x, velocity_y, should_move = action
-        target = np.array([[
-            (velocity_x / 10 + 0.5) * reward,  # Scale by reward
-            (velocity_y / 10 + 0.5) * reward,
-            1.0 if (should_move and reward > 0.5) else 0.0
-        ]])
-
-        self.network.train_step(input_vector, target)
-
 
 class ActivityNetwork:
     """
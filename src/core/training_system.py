@@ -15,7 +15,7 @@ Phase 6 Enhancements:
 9. Advanced stubbornness based on mood, trust, bond, hunger, energy
 10. Detailed training progress tracking
 """
-import numpy as np
+import random
 import time
 from typing import Dict, List, Any, Optional, Tuple
 from enum import Enum
@@ -94,7 +94,7 @@ class Trick:
         effective_learning_rate = base_learning_rate * personality_modifier * mood_modifier
 
         # Add randomness (sometimes you just get it!)
-        randomness = np.random.normal(0, 0.1)
+        randomness = random.gauss(0, 0.1)
         proficiency_gain = effective_learning_rate + randomness
 
         # Update proficiency
@@ -103,7 +103,7 @@ class Trick:
 
         # Determine success (easier as proficiency increases)
         success_chance = self.proficiency * 0.7 + 0.1  # 10% minimum chance
-        success = np.random.random() < success_chance
+        success = random.random() < success_chance
 
         if success:
             self.success_count += 1
@@ -314,7 +314,7 @@ class NameRecognition:
         """
         if self.recognition_proficiency < 0.3:
             # Still learning name - might not respond
-            if np.random.random() < 0.5:
+            if random.random() < 0.5:
                 return 'ignore'
 
         # Personality-based responses (Phase 3: All 25 types)
@@ -350,7 +350,7 @@ class NameRecognition:
         }
 
         if personality in responses:
-            return np.random.choice(responses[personality])
+            return random.choice(responses[personality])
 
         return 'look'  # Default response
 
@@ -458,6 +458,11 @@ class TrainingSystem:
         """
         self.personality = personality
         self.learned_tricks = {}  # Tricks currently being learned or mastered
+
+        # Counts of learned_tricks that can / cannot be performed yet, kept in
+        # step as proficiency crosses each trick's success threshold
+        self._known_count = 0
+        self._learning_count = 0
         self.command_recognition = CommandRecognition()
         self.name_recognition = NameRecognition(creature_name)
 
@@ -546,6 +551,7 @@ class TrainingSystem:
         )
 
         self.learned_tricks[trick_name] = trick
+        self._learning_count += 1
         return True, f"Started learning '{trick_name}'!"
 
     def practice_trick(self, trick_name: str, mood: float = 0.5) -> Tuple[bool, str, float]:
@@ -565,17 +571,19 @@ class TrainingSystem:
         trick = self.learned_tricks[trick_name]
 
         # Check stubbornness - sometimes pet refuses
-        if np.random.random() < self.learning_modifiers['stubbornness']:
+        if random.random() < self.learning_modifiers['stubbornness']:
             return False, "Refused to practice (feeling stubborn!)", 0.0
 
         # Calculate mood modifier (happy pets learn better)
         mood_modifier = 0.5 + mood * 0.5  # Range: 0.5 to 1.0
 
         # Practice the trick
+        could_perform = trick.can_perform()
         success, gain = trick.practice(
             personality_modifier=self.learning_modifiers['learning_rate'],
             mood_modifier=mood_modifier
         )
+        self._update_trick_counts(could_perform, trick.can_perform())
 
         if success:
             if trick.is_mastered():
@@ -609,7 +617,7 @@ class TrainingSystem:
 
         # Success chance based on proficiency
         success_chance = trick.proficiency * 0.9 + 0.1
-        success = np.random.random() < success_chance
+        success = random.random() < success_chance
 
         if success:
             trick.last_success = time.time()
@@ -631,7 +639,7 @@ class TrainingSystem:
         # Check for name first
         heard_name = self.name_recognition.check_for_name(text)
 
-        if heard_name and np.random.random() < 0.3:
+        if heard_name and random.random() < 0.3:
             # Sometimes just responds to name
             response = self.name_recognition.get_name_response(self.personality)
             return True, f"Heard name! Responding: {response}", response
@@ -663,7 +671,23 @@ class TrainingSystem:
             if trick.last_practiced:
                 days_since = (now - trick.last_practiced) / (24 * 3600)
                 if days_since > 1:
+                    could_perform = trick.can_perform()
                     trick.decay_skill(days_since)
+                    self._update_trick_counts(could_perform, trick.can_perform())
+
+    def _update_trick_counts(self, could_perform: bool, can_perform: bool):
+        """Move a trick between the known and learning counts if it changed."""
+        if can_perform and not could_perform:
+            self._known_count += 1
+            self._learning_count -= 1
+        elif could_perform and not can_perform:
+            self._known_count -= 1
+            self._learning_count += 1
+
+    def _recount_tricks(self):
+        """Recompute the known and learning counts from learned_tricks."""
+        self._known_count = sum(1 for trick in self.learned_tricks.values() if trick.can_perform())
+        self._learning_count = len(self.learned_tricks) - self._known_count
 
     def get_known_tricks(self) -> List[str]:
         """Get list of all tricks pet knows (can perform)."""
@@ -673,6 +697,14 @@ class TrainingSystem:
         """Get list of tricks currently being learned."""
         return [name for name, trick in self.learned_tricks.items() if not trick.can_perform()]
 
+    def get_known_trick_count(self) -> int:
+        """Get number of tricks pet can perform."""
+        return self._known_count
+
+    def get_learning_trick_count(self) -> int:
+        """Get number of tricks currently being learned."""
+        return self._learning_count
+
     def get_mastered_tricks(self) -> List[str]:
         """Get list of fully mastered tricks."""
         return [name for name, trick in self.learned_tricks.items() if trick.is_mastered()]
@@ -707,6 +739,7 @@ class TrainingSystem:
         # Restore learned tricks
         for name, trick_data in data['learned_tricks'].items():
             system.learned_tricks[name] = Trick.from_dict(trick_data)
+        system._recount_tricks()
 
         # Restore command and name recognition
         system.command_recognition = CommandRecognition.from_dict(data['command_recognition'])
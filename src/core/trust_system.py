@@ -5,6 +5,7 @@ Trust builds gradually through consistent positive interactions and care.
 Trust affects willingness to follow commands, try new things, and respond to owner.
 """
 from typing import Dict, Any, Optional, Tuple, List
+import random
 import time
 import numpy as np
 
@@ -81,20 +82,22 @@ class TrustSystem:
             'new_trust': self.trust
         })
 
-    def reduce_trust(self, amount: float, reason: str = "negative_interaction"):
+    def reduce_trust(self, amount: float, reason: str = "negative_interaction",
+                     now: Optional[float] = None):
         """
         Decrease trust value.
 
         Args:
             amount: Amount to decrease
             reason: Why trust decreased
+            now: Timestamp for the history entry; current time if None
         """
         old_trust = self.trust
         self.trust = max(0, self.trust - amount)
 
         # Record trust change
         self.trust_history.append({
-            'timestamp': time.time(),
+            'timestamp': time.time() if now is None else now,
             'change': self.trust - old_trust,
             'reason': reason,
             'new_trust': self.trust
@@ -279,7 +282,7 @@ class TrustSystem:
         confidence = base_confidence * (1.0 - trick_difficulty * 0.5)
 
         # Will try if confidence is high enough
-        will_try = confidence > 0.3 and np.random.random() < confidence
+        will_try = confidence > 0.3 and random.random() < confidence
 
         return will_try, confidence
 
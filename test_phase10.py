@@ -131,6 +131,35 @@ print("\nClearing sweat particles...")
 particles.clear_particles(EmotionType.SWEAT)
 print(f"Sweat particles after clear: {particles.get_particle_count(EmotionType.SWEAT)}")
 
+# Particles are exposed as read-only columns that step like EmotionParticle
+print("\nStepping particle columns...")
+columns = EmotionParticleEmitter()
+columns.emit_particle(EmotionType.HEARTS, pet_pos, intensity=1.0)
+for _ in range(3):
+    columns.emit_particle(EmotionType.SWEAT, pet_pos, intensity=1.0)
+assert columns.get_particle_count() == 4, "All emitted particles should be live"
+view = columns.particles
+assert all(not column.flags.writeable for column in view.values()), "Particle columns should be read-only"
+heart = columns.get_particles(EmotionType.HEARTS)
+assert len(heart['x']) == 1 and not heart['x'].flags.writeable, "Type filter should select read-only columns"
+expected = EmotionParticle(heart['x'][0], heart['y'][0], EmotionType.HEARTS,
+                           (heart['vx'][0], heart['vy'][0]), heart['lifetime'][0], heart['size'][0])
+columns.clear_particles(EmotionType.SWEAT)
+assert columns.get_particle_count() == 1, "Clearing should leave only the heart"
+columns.update(0.1, pet_pos)
+expected.update(0.1)
+moved = columns.get_particles(EmotionType.HEARTS)
+assert abs(moved['x'][0] - expected.x) < 1e-9 and abs(moved['y'][0] - expected.y) < 1e-9, \
+    "Particle columns should move like a single particle"
+columns.emit_particles_batch(EmotionType.STARS, 50, pet_pos, 1.0)
+assert len(columns.render_view()['x']) == 51, "Render view should cover every particle"
+counts = []
+while columns.get_particle_count():
+    columns.update(0.1, pet_pos)
+    counts.append(columns.get_particle_count())
+assert counts == sorted(counts, reverse=True), "Particles should only expire while thinning out"
+print(f"  Stepped {len(counts)} frames from 51 particles down to 0")
+
 print("✓ Emotion particles working!")
 
 # Test 3: Sound System
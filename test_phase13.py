@@ -66,6 +66,34 @@ print(f"  Total spent: {stats['total_spent']} coins")
 print(f"  Current balance: {stats['balance']} coins")
 print(f"  Transactions: {stats['total_transactions']}")
 
+# Bounded history: old transactions drop out of the history and the type index
+print("\nTesting bounded transaction history:")
+small = CurrencySystem(starting_balance=0, max_history=5)
+for i in range(4):
+    small.add_coins(10, TransactionType.EARNED_GAME, f"Game {i}")
+for i in range(3):
+    small.spend_coins(5, TransactionType.SPENT_SHOP, f"Shop {i}")
+kept_ids = [txn.transaction_id for txn in small.transactions]
+assert kept_ids == ['txn_3', 'txn_4', 'txn_5', 'txn_6', 'txn_7'], "Only the newest 5 should be kept"
+game_ids = [txn.transaction_id for txn in small.get_transactions_by_type(TransactionType.EARNED_GAME)]
+assert game_ids == ['txn_3', 'txn_4'], "Dropped transactions should leave the type index"
+assert len(small.get_transactions_by_type(TransactionType.SPENT_SHOP)) == 3, "Newer types stay indexed"
+print(f"  Kept {len(small.transactions)} of 7 transactions, {len(game_ids)} game earnings indexed")
+
+# Reloading keeps the same window and keeps numbering after the last ID
+small_data = small.to_dict()
+small_data['max_history'] = 3
+reloaded = CurrencySystem.from_dict(small_data)
+assert [txn.transaction_id for txn in reloaded.transactions] == ['txn_5', 'txn_6', 'txn_7'], \
+    "Reload should keep only the newest max_history transactions"
+assert len(reloaded.get_transactions_by_type(TransactionType.EARNED_GAME)) == 0, \
+    "Type index should match the reloaded history"
+reloaded.add_coins(1, TransactionType.EARNED_GAME)
+assert reloaded.transactions[-1].transaction_id == 'txn_8', "IDs should continue after reload"
+assert reloaded.to_dict()['transactions'][0]['transaction_id'] == 'txn_6', \
+    "Saved history should drop the same transactions"
+print("  Reloaded history, type index and IDs stay consistent")
+
 print("✓ Currency system working!")
 
 # Test 2: Shop System
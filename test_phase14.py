@@ -314,6 +314,65 @@ print(f"  Complete presets: {stats['complete_presets']}")
 print(f"  Total applied: {stats['total_applied']}")
 print(f"  Capacity usage: {stats['capacity_usage']:.1f}%")
 
+# Serialized presets follow every change
+print("\nChecking preset serialization after changes...")
+serialized_preset = CustomizationPreset("serialize_check", "Before", PresetType.OUTFIT)
+first = serialized_preset.to_dict()
+first['name'] = "Edited copy"
+first['tags'].append("edited")
+assert serialized_preset.to_dict()['name'] == "Before", "to_dict() should return a new dict"
+assert serialized_preset.to_dict()['tags'] == [], "Tag list should not be shared"
+serialized_preset.name = "After"
+serialized_preset.description = "Renamed"
+serialized_preset.favorite = True
+serialized_preset.thumbnail = "thumb.png"
+serialized_preset.add_tag("cozy")
+serialized_preset.apply()
+serialized_preset.update_data(pet_data={'color': 'blue'})
+changed = serialized_preset.to_dict()
+assert (changed['name'], changed['description'], changed['favorite'], changed['thumbnail']) == \
+    ("After", "Renamed", True, "thumb.png"), "Setters should show in to_dict()"
+assert changed['tags'] == ["cozy"] and changed['times_applied'] == 1, "Methods should show in to_dict()"
+assert changed['pet_data'] == {'color': 'blue'}, "update_data should show in to_dict()"
+serialized_preset.remove_tag("cozy")
+serialized_preset.pet_data = {'color': 'red'}
+serialized_preset.times_applied = 5
+changed = serialized_preset.to_dict()
+assert changed['tags'] == [], "remove_tag should show in to_dict()"
+assert changed['pet_data'] == {'color': 'red'} and changed['times_applied'] == 5, \
+    "Direct attribute writes should show in to_dict()"
+print("✓ Serialized presets stay up to date")
+
+# Type and tag indexes, recent list and most used follow every change
+print("\nChecking preset indexes...")
+indexed = CustomizationPresets()
+look_a = indexed.create_preset("Look A", PresetType.OUTFIT)
+look_b = indexed.create_preset("Look B", PresetType.OUTFIT)
+room_a = indexed.create_preset("Room A", PresetType.ROOM)
+look_a.add_tag("summer")
+room_a.add_tag("summer")
+assert indexed.get_presets_by_type(PresetType.OUTFIT) == [look_a, look_b], "Type index should list outfits"
+assert indexed.get_presets_by_tag("summer") == [look_a, room_a], "Tag index should follow add_tag"
+room_a.remove_tag("summer")
+assert indexed.get_presets_by_tag("summer") == [look_a], "Tag index should follow remove_tag"
+
+for preset_id in (look_a.preset_id, look_b.preset_id, look_b.preset_id, room_a.preset_id):
+    indexed.apply_preset(preset_id)
+assert indexed.most_used_preset == look_b.preset_id, "Most applied preset should lead"
+assert indexed.get_recent_presets() == [room_a, look_b, look_a], "Recent list should be newest first"
+
+indexed.delete_preset(look_b.preset_id)
+assert indexed.get_presets_by_type(PresetType.OUTFIT) == [look_a], "Deleted preset should leave the type index"
+assert indexed.most_used_preset in (look_a.preset_id, room_a.preset_id), "Most used should be recomputed"
+assert indexed.get_recent_presets() == [room_a, look_a], "Deleted preset should leave the recent list"
+
+restored_index = CustomizationPresets.from_dict(indexed.to_dict())
+assert [p.name for p in restored_index.get_presets_by_tag("summer")] == ["Look A"], "Tags should be re-indexed on load"
+assert [p.name for p in restored_index.get_recent_presets()] == ["Room A", "Look A"], "Recent order should survive load"
+restored_index.get_preset(room_a.preset_id).add_tag("winter")
+assert [p.name for p in restored_index.get_presets_by_tag("winter")] == ["Room A"], "Loaded presets should update the index"
+print("✓ Preset indexes stay in step")
+
 print("✓ Customization presets working!")
 
 # Test 5: Persistence (Save/Load)
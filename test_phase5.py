@@ -14,11 +14,12 @@ import sys
 sys.path.insert(0, '/home/user/desktop_pet/src')
 
 from core.creature import Creature
-from core.config import PersonalityType
+from core.config import PersonalityType, BehaviorState
 from core.bonding_system import BondingSystem, BondLevel
 from core.trust_system import TrustSystem
 from core.emotional_states import EmotionalStateManager, EmotionalState
 from core.preference_system import PreferenceSystem
+from core.element_system import ElementType
 from core.name_calling import NameCallingSystem
 import time
 
@@ -153,6 +154,57 @@ time.sleep(0.1)  # Brief delay
 emotions.set_owner_presence(True, bond_level=80, trust_level=70)
 print(f"  Owner returned, reunion excitement: {emotions.reunion_excitement_level:.2f}")
 
+# Test state expiry (expiry heap, including stale entries)
+print("\nTesting state expiry:")
+expiry = EmotionalStateManager()
+start = time.time()
+
+# Re-setting a state leaves its old expiry behind; that must not expire it
+expiry.set_emotional_state(EmotionalState.JEALOUS, 0.5, duration=10)
+expiry.set_emotional_state(EmotionalState.JEALOUS, 0.7, duration=100)
+expiry.update(0.0, now=start + 50)
+assert expiry.get_state_intensity(EmotionalState.JEALOUS, now=start + 50) == 0.7, \
+    "Re-set state should outlive its earlier expiry"
+expiry.update(0.0, now=start + 150)
+assert EmotionalState.JEALOUS not in expiry.current_states, "Re-set state should expire on its own time"
+print("  Re-set state expires on its latest duration")
+
+# A removed state's pending expiry must not touch a later setting of it
+expiry.set_emotional_state(EmotionalState.LONGING, 0.5, duration=10)
+expiry.remove_emotional_state(EmotionalState.LONGING)
+expiry.update(0.0, now=start + 20)
+assert not expiry.current_states, "Removed state should stay removed"
+expiry.set_emotional_state(EmotionalState.LONGING, 0.6, duration=100)
+expiry.update(0.0, now=start + 50)
+assert expiry.has_state(EmotionalState.LONGING, now=start + 50), \
+    "Stale expiry of a removed state should be skipped"
+expiry.remove_emotional_state(EmotionalState.LONGING)
+print("  Removed state's old expiry is ignored")
+
+# Many re-sets rebuild the heap instead of growing it without bound
+for i in range(200):
+    expiry.set_emotional_state(EmotionalState.CONTENT, 0.5, duration=10 + i)
+expiry.set_emotional_state(EmotionalState.YEARNING, 0.4, duration=5)
+heap_size = len(expiry._expiry_heap)
+assert heap_size <= 4 * len(expiry.current_states) + 17, "Heap should stay bounded"
+expiry.update(0.0, now=start + 100)
+assert expiry.get_current_states(now=start + 100) == {'content': 0.5}, \
+    "Only the expired state should be gone after a rebuild"
+expiry.update(0.0, now=start + 300)
+assert not expiry.current_states, "Every state should expire after a rebuild"
+print(f"  Heap stays bounded ({heap_size} entries after 200 re-sets)")
+
+# Restored states are scheduled for expiry again
+expiry.set_emotional_state(EmotionalState.POSSESSIVE, 0.8, duration=10)
+expiry.set_emotional_state(EmotionalState.INSECURE, 0.6, duration=100)
+restored = EmotionalStateManager.from_dict(expiry.to_dict())
+restored.update(0.0, now=start + 50)
+assert restored.get_current_states(now=start + 50) == {'insecure': 0.6}, \
+    "Restored states should expire on schedule"
+restored.update(0.0, now=start + 150)
+assert not restored.current_states, "Restored states should all expire"
+print("  Restored states expire on schedule")
+
 print("✓ Emotional states working!")
 
 # Test 4: Preference System
@@ -292,6 +344,29 @@ print(f"  Trust after 5 interactions: {stats['trust']:.1f}")
 favorites = creature.get_favorite_items()
 print(f"  Top toy: {favorites.get('top_toy', 'None yet')}")
 
+# Favorites are cached between preference changes, but never go stale
+favorites['top_toy'] = 'edited'
+assert creature.get_favorite_items()['top_toy'] != 'edited', "Returned favorites should be a copy"
+for i in range(10):
+    creature.preferences.record_experience('toy', 'laser', enjoyment=1.0)
+assert creature.get_favorite_items()['top_toy'] == 'laser', "New experiences should refresh favorites"
+print(f"  Top toy after laser play: {creature.get_favorite_items()['top_toy']}")
+
+# Command fatigue counts only interactions from the last 5 minutes
+commands = Creature(creature_type='dragon', personality=PersonalityType.LOYAL)
+start = time.time()
+for offset in (-400, -299, -200, -100):
+    commands.interact('talk', now=start + offset)
+commands.check_command_compliance('sit', now=start)
+expected_recent = sum(1 for e in commands.interaction_history if start - e.timestamp < 300)
+assert len(commands._recent_interaction_times) == expected_recent == 3, "Only recent commands should count"
+commands.check_command_compliance('sit', now=start + 150)
+assert len(commands._recent_interaction_times) == 1, "Older commands should drop out of the window"
+reloaded_commands = Creature.from_dict(commands.to_dict())
+reloaded_commands.check_command_compliance('sit', now=start + 150)
+assert len(reloaded_commands._recent_interaction_times) == 1, "Command window should be rebuilt on load"
+print(f"  Recent commands counted: {expected_recent} of 4")
+
 # Test calling by name
 print(f"\nCalling {creature.name} by name:")
 result = creature.call_by_name(creature.name)
@@ -316,6 +391,42 @@ creature.trigger_jealousy(attention_amount=0.5)
 emotions_active = creature.emotional_states.get_current_states()
 print(f"  Active emotional states: {list(emotions_active.keys())}")
 
+# Network state snapshots are independent unless a dict is passed in
+print(f"\nNetwork state snapshots:")
+snapshot = creature.get_state_for_networks()
+hunger_then = snapshot['hunger']
+creature.hunger = min(100.0, hunger_then + 10)
+later = creature.get_state_for_networks()
+assert later is not snapshot, "Each call should return a new dict"
+assert snapshot['hunger'] == hunger_then, "Earlier snapshot should not change"
+reused = {}
+assert creature.get_state_for_networks(out=reused) is reused, "out= dict should be filled in place"
+assert reused['hunger'] == later['hunger'], "out= dict should hold the current state"
+print(f"  Snapshots stay independent")
+
+# Stat decay is batched, but each frame is charged at its own rate
+print(f"\nStat decay across a state change:")
+vitals = Creature(creature_type='dragon', personality=PersonalityType.LOYAL)
+start = time.time()
+vitals.last_interaction_time = start - 200
+vitals.energy = 50.0
+vitals.current_state = BehaviorState.IDLE
+vitals.update(0.25, now=start)
+vitals.current_state = BehaviorState.SLEEPING
+vitals.update(0.25, now=start + 0.25)
+vitals.update(0.75, now=start + 1.0)
+expected_energy = 50.0 + 0.2 * 0.25 + 2.0 * 1.0  # Idle recovery, then sleep recovery
+assert abs(vitals.energy - expected_energy) < 1e-9, "Each frame should use its own energy rate"
+print(f"  Energy after idle then sleep: {vitals.energy:.2f}")
+
+# Happiness only drops for the frames after 5 minutes without interaction
+vitals.happiness = 80.0
+vitals.update(0.25, now=start + 50)
+vitals.update(0.25, now=start + 150)
+vitals.update(0.75, now=start + 151)
+assert abs(vitals.happiness - (80.0 - 0.1 * 1.0)) < 1e-9, "Only neglected frames should lower happiness"
+print(f"  Happiness after becoming neglected mid-window: {vitals.happiness:.2f}")
+
 print("✓ Creature integration working!")
 
 # Test 7: Persistence
@@ -363,6 +474,37 @@ assert loaded.trust.trust == original.trust.trust, "Trust should match"
 # Verify preferences loaded (check the internal data structures)
 assert len(loaded.preferences.toy_preferences) > 0, "Toy preferences should be loaded"
 
+# Changes made after a save must reach the next save
+original.element.secondary_element = ElementType.WATER
+original.element.elemental_affinity_bonus = 0.25
+original.element.elemental_power = 1.5
+original.preferences.toy_preferences['feather'] = 12.0
+original.preferences.favorite_toy = 'ball'
+resaved = Creature.from_dict(original.to_dict())
+assert resaved.element.secondary_element == ElementType.WATER, "Secondary element should be re-saved"
+assert resaved.element.elemental_affinity_bonus == 0.25, "Affinity bonus should be re-saved"
+assert resaved.element.elemental_power == 1.5, "Elemental power should be re-saved"
+assert resaved.preferences.toy_preferences['feather'] == 12.0, "Edited preferences should be re-saved"
+assert resaved.preferences.favorite_toy == 'ball', "Favorite toy should be re-saved"
+print("  Changes after a save are included in the next save")
+
+# Recent-interaction encodings match the history after it wraps and reloads
+ring = Creature(creature_type='dragon', personality=PersonalityType.PLAYFUL)
+ring_types = ['feed', 'play_ball', 'pet', 'talk', 'hide']
+for i in range(130):
+    ring.interact(ring_types[i % len(ring_types)], positive=(i % 3 != 0))
+type_mapping = {'feed': 0.2, 'play_ball': 0.4, 'pet': 0.6, 'talk': 0.8}
+expected_types = [type_mapping.get(e.interaction_type, 0.5) for e in ring.interaction_history[-7:]]
+expected_quality = [1.0 if e.positive else 0.3 for e in ring.interaction_history[-12:]]
+assert ring.get_recent_interaction_types(7) == expected_types, "Type encodings should follow the history"
+assert ring.get_recent_interaction_quality(12) == expected_quality, "Quality encodings should follow the history"
+assert len(ring.get_recent_interaction_quality(150)) == 150, "Long requests should be padded"
+ring_loaded = Creature.from_dict(ring.to_dict())
+assert ring_loaded.get_recent_interaction_types(7) == expected_types, "Type encodings should survive a reload"
+assert ring_loaded.get_recent_interaction_quality(150) == ring.get_recent_interaction_quality(150), \
+    "Quality encodings should survive a reload"
+print("  Recent interaction encodings match the history after wrapping and reloading")
+
 print("✓ Persistence working!")
 
 # Test 8: Bond Level Progression
@@ -374,6 +374,16 @@ if creature.phase7_enabled:
         trigger='white_coats'
     )
 
+    # Even a harmless scare is logged in the trust and bond histories
+    creature.trust.trust_history.clear()
+    creature.bonding.bond_history.clear()
+    creature.record_trauma('loud_noise', {'source': 'door'}, severity=0.0)
+    assert [e['reason'] for e in creature.trust.trust_history] == ['traumatic_experience'], \
+        "Trust history should record the trauma"
+    assert [e['reason'] for e in creature.bonding.bond_history] == ['traumatic_experience'], \
+        "Bond history should record the trauma"
+    print("  Zero-severity trauma still recorded in trust and bond history")
+
     # Check fear trigger
     is_scared, fear_level = creature.check_fear_trigger('white_coats')
     print(f"  Scared of white_coats? {is_scared} (fear level: {fear_level:.2f})")